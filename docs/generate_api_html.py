@@ -1,42 +1,106 @@
 #!/usr/bin/env python
 """Generate HTML API documentation using pdoc."""
 
-import subprocess
-import shutil
+import hashlib
+import json
+import os
+import sys
 from pathlib import Path
 
-def generate_api_docs():
-    """Generate HTML API documentation using pdoc."""
+import pdoc
+import pdoc.render
+
+PACKAGE = "teval"
+
+# Options passed to pdoc.render.configure(); part of the cache key, so
+# changing them triggers a re-render
+RENDER_OPTIONS = {
+    "footer_text": "teval API Documentation",
+    "show_source": False,
+}
+
+
+def _source_hashes(package_dir: Path) -> dict:
+    """Return a content hash for each Python module in the package, keyed by relative path."""
+    hashes = {}
+    for path in sorted(package_dir.rglob("*.py")):
+        hashes[path.relative_to(package_dir).as_posix()] = hashlib.sha256(path.read_bytes()).hexdigest()
+    return hashes
+
+
+def _cache_payload(package_dir: Path) -> dict:
+    """Return everything the rendered output depends on: sources, render options and pdoc version."""
+    return {
+        "modules": _source_hashes(package_dir),
+        "render_options": RENDER_OPTIONS,
+        "pdoc_version": pdoc.__version__,
+    }
+
+
+def _read_cache(cache_file: Path):
+    """Return the payload stored by the last run, or None if it is missing or unreadable."""
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _remove_stale_pages(output_dir: Path, modules: dict):
+    """Delete HTML pages of modules that no longer exist in the package."""
+    module_dir = output_dir / PACKAGE
+    if not module_dir.is_dir():
+        return
+    names = {path[:-len(".py")] for path in modules}
+    with os.scandir(module_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".html") and entry.name[:-len(".html")] not in names:
+                print(f"Removing stale page {entry.path}")
+                os.remove(entry.path)
+
+
+def generate_api_docs(force: bool = False):
+    """
+    Generate HTML API documentation using pdoc.
+
+    Documentation is rendered in-process and only when something it depends
+    on changed since the last run. The module paths and content hashes, the
+    render options and the pdoc version are stored in
+    ``api_html/.cache.json``; the run is skipped only if they all match and
+    ``index.html`` still exists. Pass ``force=True`` (or ``--force`` on the
+    command line) to always regenerate.
+    """
     # Define paths
     docs_dir = Path(__file__).parent
+    package_dir = docs_dir.parent / PACKAGE
     output_dir = docs_dir / "api_html"
+    cache_file = output_dir / ".cache.json"
 
-    # Clean existing documentation if it exists
-    if output_dir.exists():
-        print(f"Removing existing documentation at {output_dir}")
-        shutil.rmtree(output_dir)
+    # Skip regeneration when nothing the output depends on changed
+    payload = _cache_payload(package_dir)
+    if not force and (output_dir / "index.html").exists() and _read_cache(cache_file) == payload:
+        print(f"Documentation at {output_dir}/ is up to date.")
+        return True
 
     # Generate new documentation
     print("Generating HTML API documentation with pdoc...")
-    cmd = [
-        "pdoc",
-        "-o", str(output_dir),
-        "--no-show-source",
-        "--footer-text", "teval API Documentation",
-        "teval"
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    if result.returncode != 0:
-        print(f"Error generating documentation:\n{result.stderr}")
+    sys.path.insert(0, str(package_dir.parent))
+    pdoc.render.configure(**RENDER_OPTIONS)
+    try:
+        pdoc.pdoc(PACKAGE, output_directory=output_dir)
+    except (ImportError, RuntimeError, ValueError, OSError) as e:
+        # pdoc raises ImportError/ValueError for unknown modules, RuntimeError
+        # when a module fails to import, and OSError when writing fails
+        print(f"Error generating documentation:\n{e}")
         return False
 
+    _remove_stale_pages(output_dir, payload["modules"])
+    cache_file.write_text(json.dumps(payload, indent=2, sort_keys=True))
+
     print(f"✅ Documentation generated successfully at {output_dir}/")
     print(f"   Open {output_dir}/index.html in your browser to view.")
 
     return True
 
 if __name__ == "__main__":
-    success = generate_api_docs()
-    exit(0 if success else 1)
\ No newline at end of file
+    success = generate_api_docs(force="--force" in sys.argv[1:])
+    exit(0 if success else 1)
@@ -81,27 +81,28 @@ def example_batch_comparison():
         passing_score_threshold=2,
     )
 
-    ResultModel = rubric.to_pydantic_model()
-
+    # Simulated results are trusted data, so build_result(..., validate=False)
+    # skips the per-instance validation. Use rubric.validate_and_return() for
+    # real LLM output.
     # Simulate 100 evaluations with gemini-2.5-flash
     print("\nSimulating 100 evaluations with gemini-2.5-flash...")
     flash_results = [
-        ResultModel(M1=True, C1=True, C2=True, C3=False),   # Pass
-        ResultModel(M1=True, C1=False, C2=True, C3=True),   # Pass
-        ResultModel(M1=False, C1=True, C2=True, C3=True),   # Fail (mandatory)
-        ResultModel(M1=True, C1=True, C2=False, C3=False),  # Fail (threshold)
-        ResultModel(M1=True, C1=True, C2=True, C3=True),    # Pass
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": False}, validate=False),   # Pass
+        rubric.build_result({"M1": True, "C1": False, "C2": True, "C3": True}, validate=False),   # Pass
+        rubric.build_result({"M1": False, "C1": True, "C2": True, "C3": True}, validate=False),   # Fail (mandatory)
+        rubric.build_result({"M1": True, "C1": True, "C2": False, "C3": False}, validate=False),  # Fail (threshold)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True}, validate=False),    # Pass
         # ... in practice, you'd have 100 samples here
     ]
 
     # Simulate 100 evaluations with gemini-2.0-pro on SAME samples
     print("Simulating 100 evaluations with gemini-2.0-pro...")
     pro_results = [
-        ResultModel(M1=True, C1=True, C2=False, C3=True),   # Pass (aligned - both pass)
-        ResultModel(M1=True, C1=True, C2=True, C3=True),    # Pass (aligned - both pass)
-        ResultModel(M1=False, C1=False, C2=False, C3=False),# Fail (aligned - both fail)
-        ResultModel(M1=True, C1=True, C2=True, C3=True),    # Pass (NOT aligned - flash failed)
-        ResultModel(M1=True, C1=False, C2=True, C3=True),   # Pass (aligned - both pass)
+        rubric.build_result({"M1": True, "C1": True, "C2": False, "C3": True}, validate=False),     # Pass (aligned - both pass)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True}, validate=False),      # Pass (aligned - both pass)
+        rubric.build_result({"M1": False, "C1": False, "C2": False, "C3": False}, validate=False),  # Fail (aligned - both fail)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True}, validate=False),      # Pass (NOT aligned - flash failed)
+        rubric.build_result({"M1": True, "C1": False, "C2": True, "C3": True}, validate=False),     # Pass (aligned - both pass)
         # ... in practice, you'd have 100 samples here
     ]
 
@@ -143,34 +144,34 @@ def example_human_llm_alignment():
         passing_score_threshold=3,
     )
 
-    ResultModel = rubric.to_pydantic_model()
-
+    # Simulated results are trusted data, so build_result(..., validate=False)
+    # skips the per-instance validation.
     # Human teacher evaluations of 10 essays
     human_results = [
-        ResultModel(M1=True, C1=True, C2=True, C3=True, C4=True),    # Pass
-        ResultModel(M1=True, C1=False, C2=True, C3=True, C4=True),   # Pass
-        ResultModel(M1=True, C1=False, C2=False, C3=True, C4=False), # Fail
-        ResultModel(M1=False, C1=True, C2=True, C3=True, C4=True),   # Fail (mandatory)
-        ResultModel(M1=True, C1=True, C2=True, C3=False, C4=True),   # Pass
-        ResultModel(M1=True, C1=True, C2=False, C3=True, C4=True),   # Pass
-        ResultModel(M1=True, C1=False, C2=False, C3=False, C4=False),# Fail
-        ResultModel(M1=True, C1=True, C2=True, C3=True, C4=False),   # Pass
-        ResultModel(M1=True, C1=True, C2=True, C3=True, C4=True),    # Pass
-        ResultModel(M1=True, C1=False, C2=True, C3=True, C4=True),   # Pass
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True, "C4": True}, validate=False),      # Pass
+        rubric.build_result({"M1": True, "C1": False, "C2": True, "C3": True, "C4": True}, validate=False),     # Pass
+        rubric.build_result({"M1": True, "C1": False, "C2": False, "C3": True, "C4": False}, validate=False),   # Fail
+        rubric.build_result({"M1": False, "C1": True, "C2": True, "C3": True, "C4": True}, validate=False),     # Fail (mandatory)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": False, "C4": True}, validate=False),     # Pass
+        rubric.build_result({"M1": True, "C1": True, "C2": False, "C3": True, "C4": True}, validate=False),     # Pass
+        rubric.build_result({"M1": True, "C1": False, "C2": False, "C3": False, "C4": False}, validate=False),  # Fail
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True, "C4": False}, validate=False),     # Pass
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True, "C4": True}, validate=False),      # Pass
+        rubric.build_result({"M1": True, "C1": False, "C2": True, "C3": True, "C4": True}, validate=False),     # Pass
     ]
 
     # LLM evaluations of same 10 essays
     llm_results = [
-        ResultModel(M1=True, C1=True, C2=True, C3=True, C4=True),    # Pass (aligned)
-        ResultModel(M1=True, C1=True, C2=True, C3=True, C4=True),    # Pass (aligned)
-        ResultModel(M1=True, C1=True, C2=False, C3=True, C4=False),  # Fail (aligned)
-        ResultModel(M1=False, C1=False, C2=True, C3=True, C4=True),  # Fail (aligned)
-        ResultModel(M1=True, C1=False, C2=True, C3=False, C4=True),  # Pass (aligned)
-        ResultModel(M1=True, C1=False, C2=False, C3=True, C4=True),  # Fail (NOT aligned)
-        ResultModel(M1=True, C1=False, C2=False, C3=False, C4=True), # Fail (aligned)
-        ResultModel(M1=True, C1=True, C2=True, C3=False, C4=True),   # Pass (aligned)
-        ResultModel(M1=True, C1=True, C2=True, C3=True, C4=True),    # Pass (aligned)
-        ResultModel(M1=True, C1=True, C2=True, C3=True, C4=True),    # Pass (aligned)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True, "C4": True}, validate=False),     # Pass (aligned)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True, "C4": True}, validate=False),     # Pass (aligned)
+        rubric.build_result({"M1": True, "C1": True, "C2": False, "C3": True, "C4": False}, validate=False),   # Fail (aligned)
+        rubric.build_result({"M1": False, "C1": False, "C2": True, "C3": True, "C4": True}, validate=False),   # Fail (aligned)
+        rubric.build_result({"M1": True, "C1": False, "C2": True, "C3": False, "C4": True}, validate=False),   # Pass (aligned)
+        rubric.build_result({"M1": True, "C1": False, "C2": False, "C3": True, "C4": True}, validate=False),   # Fail (NOT aligned)
+        rubric.build_result({"M1": True, "C1": False, "C2": False, "C3": False, "C4": True}, validate=False),  # Fail (aligned)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": False, "C4": True}, validate=False),    # Pass (aligned)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True, "C4": True}, validate=False),     # Pass (aligned)
+        rubric.build_result({"M1": True, "C1": True, "C2": True, "C3": True, "C4": True}, validate=False),     # Pass (aligned)
     ]
 
     alignment = rubric.calculate_alignment(human_results, llm_results)
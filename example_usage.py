@@ -181,7 +181,7 @@ To use with LLMs like Gemini or OpenAI:
    print(result.M1)  # Type-safe access
 
 3. Validate the LLM response (accepts both JSON string and dict):
-   # Option A: Pass the JSON string directly
+   # Option A: Pass the JSON string directly (parsed once, in pydantic-core)
    passes = rubric.validate_result(response.text)
 
    # Option B: Parse first, then pass dict
@@ -0,0 +1,87 @@
+"""Shared fixtures for the teval test suite."""
+
+import pytest
+
+from teval import EvaluationRubric, MetricDefinition
+
+
+# Rubrics are immutable, so one instance per shape can safely be shared by
+# every test that only reads from it.
+
+@pytest.fixture(scope="session")
+def mixed_rubric():
+    """One mandatory and two cumulative metrics, one of which must pass."""
+    return EvaluationRubric(
+        rubric_id="test_v1",
+        metrics=[
+            MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+            MetricDefinition(id="C1", rubric="Cumulative 1"),
+            MetricDefinition(id="C2", rubric="Cumulative 2"),
+        ],
+        passing_score_threshold=1,
+    )
+
+
+@pytest.fixture(scope="session")
+def partitioned_rubric():
+    """Two mandatory and three cumulative metrics, two of which must pass."""
+    return EvaluationRubric(
+        rubric_id="test_v1",
+        metrics=[
+            MetricDefinition(id="M1", rubric="Mandatory 1", mandatory=True),
+            MetricDefinition(id="M2", rubric="Mandatory 2", mandatory=True),
+            MetricDefinition(id="C1", rubric="Cumulative 1"),
+            MetricDefinition(id="C2", rubric="Cumulative 2"),
+            MetricDefinition(id="C3", rubric="Cumulative 3"),
+        ],
+        passing_score_threshold=2,
+    )
+
+
+@pytest.fixture(scope="session")
+def single_mandatory_rubric():
+    """A single mandatory metric and no cumulative metrics."""
+    return EvaluationRubric(
+        rubric_id="test_v1",
+        metrics=[
+            MetricDefinition(id="M1", rubric="Test metric", mandatory=True),
+        ],
+        passing_score_threshold=0,
+    )
+
+
+# Metric lists for the rubric size-limit tests, built once per session.
+
+@pytest.fixture(scope="session")
+def metrics_101():
+    """101 cumulative metrics, one more than a rubric allows."""
+    # The IDs are known to be valid, so skip per-metric validation
+    return [MetricDefinition.build_trusted(f"M{i}", f"Metric {i}") for i in range(101)]
+
+
+@pytest.fixture(scope="session")
+def metrics_21_mandatory():
+    """21 mandatory metrics, one more than a rubric allows."""
+    return [
+        MetricDefinition(id=f"M{i}", rubric=f"Mandatory {i}", mandatory=True)
+        for i in range(21)
+    ]
+
+
+@pytest.fixture(scope="session")
+def metrics_100_with_20_mandatory():
+    """Exactly 100 metrics, 20 of them mandatory, i.e. at both limits."""
+    # Only the rubric-level limits are under test, so skip per-metric validation
+    return [
+        MetricDefinition.build_trusted(f"M{i}", f"Mandatory {i}", mandatory=True)
+        for i in range(20)
+    ] + [
+        MetricDefinition.build_trusted(f"C{i}", f"Cumulative {i}")
+        for i in range(20, 100)
+    ]
+
+
+@pytest.fixture(scope="session")
+def mixed_result_model(mixed_rubric):
+    """The result model generated from ``mixed_rubric``, built once per session."""
+    return mixed_rubric.to_pydantic_model()
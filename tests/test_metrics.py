@@ -1,10 +1,70 @@
 """Tests for teval.metrics module."""
 
+import functools
+import gc
+import pickle
+import re
+import sys
+import weakref
+
 import pytest
 from pydantic import ValidationError, BaseModel
 
 from teval import EvaluationRubric, MetricDefinition
 
+# Error patterns shared by the parametrized metric ID validation cases
+INVALID_IDENTIFIER_RE = re.compile("not a valid identifier")
+PYTHON_KEYWORD_RE = re.compile("Python keyword")
+RESERVED_ATTRIBUTE_RE = re.compile("conflicts with reserved")
+
+# pytest.raises bound to the exception every model validation failure raises
+raises_validation_error = functools.partial(pytest.raises, ValidationError)
+
+
+def assert_contains_all(text, required):
+    """Assert that every required substring occurs in text, listing all misses."""
+    missing = [substring for substring in required if substring not in text]
+    assert not missing, f"missing substrings: {missing}"
+
+
+def assert_has_lines(text, required_lines):
+    """Assert that every required line occurs verbatim in text, listing all misses."""
+    missing = required_lines - set(text.splitlines())
+    assert not missing, f"missing lines: {sorted(missing)}"
+
+
+# Shared results for the mixed_rubric and single_mandatory_rubric fixtures.
+# The library only reads results, so these are never mutated.
+MIXED_RESULT_PASS = {"M1": True, "C1": True, "C2": False}
+MIXED_RESULT_MANDATORY_FAIL = {"M1": False, "C1": True, "C2": True}
+MIXED_RESULT_CUMULATIVE_FAIL = {"M1": True, "C1": False, "C2": False}
+SINGLE_RESULT_PASS = {"M1": True}
+
+# Exact lines expected in the prompt for the code_review_v1 rubric
+PROMPT_REQUIRED_LINES = frozenset({
+    "# Evaluation Rubric: code_review_v1",
+    "## Mandatory Criteria (ALL must pass)",
+    "## Cumulative Criteria",
+    "(Must pass at least 2 of 3)",
+    "## Instructions",
+    "- **M1**: Code compiles without errors",
+    "- **M2**: No security vulnerabilities",
+    "- **C1**: Follows style guide",
+    "- **C2**: Has unit tests",
+    "- **C3**: Well documented",
+    "- All 2 mandatory criteria must pass.",
+    "- At least 2 cumulative criteria must pass.",
+})
+
+# Exact section lines expected in a passing report for the test_v1 rubric
+REPORT_REQUIRED_LINES = frozenset({
+    "# Evaluation Report: test_v1",
+    "**Overall Result: PASS**",
+    "## Mandatory Criteria (ALL must pass)",
+    "## Cumulative Criteria",
+    "## Requirements for Passing",
+})
+
 
 class TestMetricDefinition:
     """Tests for MetricDefinition model."""
@@ -25,59 +85,89 @@ class TestMetricDefinition:
 
     def test_metric_definition_extra_fields_forbidden(self):
         """Test that extra fields are not allowed."""
-        with pytest.raises(ValidationError):
+        with raises_validation_error():
             MetricDefinition(
                 id="M1", rubric="Test rubric", extra_field="not allowed"
             )
 
+    def test_schema_validators_built_once(self, mixed_rubric):
+        """Test that building and copying models reuses the class-level validators."""
+        metric_validator = MetricDefinition.__pydantic_validator__
+        rubric_validator = EvaluationRubric.__pydantic_validator__
+        rubric_serializer = EvaluationRubric.__pydantic_serializer__
+
+        MetricDefinition(id="M1", rubric="Test rubric")
+        MetricDefinition.build_trusted("C1", "Trusted rubric")
+        mixed_rubric.model_copy(update={"passing_score_threshold": 2})
+        EvaluationRubric(rubric_id="test_v1", metrics=list(mixed_rubric.metrics), passing_score_threshold=0)
+        mixed_rubric.model_dump()
+
+        assert MetricDefinition.__pydantic_validator__ is metric_validator
+        assert EvaluationRubric.__pydantic_validator__ is rubric_validator
+        assert EvaluationRubric.__pydantic_serializer__ is rubric_serializer
+
     def test_metric_definition_missing_required_fields(self):
         """Test that required fields must be provided."""
-        with pytest.raises(ValidationError):
+        with raises_validation_error():
             MetricDefinition(id="M1")  # Missing rubric
 
-        with pytest.raises(ValidationError):
+        with raises_validation_error():
             MetricDefinition(rubric="Test rubric")  # Missing id
 
-    def test_metric_id_validation_valid(self):
+    def test_metric_definition_is_frozen(self):
+        """Test that metric definitions are immutable and hashable."""
+        metric = MetricDefinition(id="M1", rubric="Test rubric")
+        with raises_validation_error():
+            metric.mandatory = True
+        assert hash(metric) == hash(MetricDefinition(id="M1", rubric="Test rubric"))
+
+    def test_build_trusted(self):
+        """Test building a metric definition without validation."""
+        metric = MetricDefinition.build_trusted("M1", "Test rubric", mandatory=True)
+        assert metric == MetricDefinition(id="M1", rubric="Test rubric", mandatory=True)
+
+    def test_metric_ids_interned(self):
+        """Test that validated and trusted metric IDs are interned."""
+        # Build the ID at runtime so it is not a compile-time constant
+        dynamic_id = "".join(["metric_", "42"])
+        assert MetricDefinition(id=dynamic_id, rubric="Test").id is sys.intern("metric_42")
+        assert MetricDefinition.build_trusted(dynamic_id, "Test").id is sys.intern("metric_42")
+
+    @pytest.mark.parametrize("valid_id", ["M1", "metric_1", "_private", "camelCase", "UPPER_CASE"])
+    def test_metric_id_validation_valid(self, valid_id):
         """Test valid metric IDs are accepted."""
-        # Valid IDs should work
-        valid_ids = ["M1", "metric_1", "_private", "camelCase", "UPPER_CASE"]
-        for valid_id in valid_ids:
-            metric = MetricDefinition(id=valid_id, rubric="Test")
-            assert metric.id == valid_id
+        metric = MetricDefinition(id=valid_id, rubric="Test")
+        assert metric.id == valid_id
 
     def test_metric_id_validation_empty(self):
         """Test empty metric ID is rejected."""
-        with pytest.raises(ValidationError, match="Metric ID cannot be empty"):
+        with raises_validation_error(match="Metric ID cannot be empty"):
             MetricDefinition(id="", rubric="Test")
 
     def test_metric_id_validation_too_long(self):
         """Test metric ID length limit."""
         long_id = "a" * 101  # 101 characters, over the 100 limit
-        with pytest.raises(ValidationError, match="too long"):
+        with raises_validation_error(match="too long"):
             MetricDefinition(id=long_id, rubric="Test")
 
-    def test_metric_id_validation_invalid_identifier(self):
+    @pytest.mark.parametrize("invalid_id", ["1metric", "metric-1", "metric.1", "metric name", "metric@test"])
+    def test_metric_id_validation_invalid_identifier(self, invalid_id):
         """Test invalid Python identifiers are rejected."""
-        invalid_ids = ["1metric", "metric-1", "metric.1", "metric name", "metric@test"]
-        for invalid_id in invalid_ids:
-            with pytest.raises(ValidationError, match="not a valid identifier"):
-                MetricDefinition(id=invalid_id, rubric="Test")
+        with raises_validation_error(match=INVALID_IDENTIFIER_RE):
+            MetricDefinition(id=invalid_id, rubric="Test")
 
-    def test_metric_id_validation_python_keyword(self):
+    @pytest.mark.parametrize("keyword_id", ["class", "def", "return", "if", "for", "import"])
+    def test_metric_id_validation_python_keyword(self, keyword_id):
         """Test Python keywords are rejected as metric IDs."""
-        keywords = ["class", "def", "return", "if", "for", "import"]
-        for keyword_id in keywords:
-            with pytest.raises(ValidationError, match="Python keyword"):
-                MetricDefinition(id=keyword_id, rubric="Test")
+        with raises_validation_error(match=PYTHON_KEYWORD_RE):
+            MetricDefinition(id=keyword_id, rubric="Test")
 
-    def test_metric_id_validation_reserved_attributes(self):
+    @pytest.mark.parametrize("reserved_id", ["dict", "json", "model_dump", "model_config", "passes",
+                                             "get_failed_metrics", "get_passed_metrics", "to_report"])
+    def test_metric_id_validation_reserved_attributes(self, reserved_id):
         """Test reserved Pydantic attributes are rejected."""
-        reserved_ids = ["dict", "json", "model_dump", "model_config", "passes",
-                       "get_failed_metrics", "get_passed_metrics", "to_report"]
-        for reserved_id in reserved_ids:
-            with pytest.raises(ValidationError, match="conflicts with reserved"):
-                MetricDefinition(id=reserved_id, rubric="Test")
+        with raises_validation_error(match=RESERVED_ATTRIBUTE_RE):
+            MetricDefinition(id=reserved_id, rubric="Test")
 
 
 class TestEvaluationRubric:
@@ -98,43 +188,35 @@ class TestEvaluationRubric:
         assert len(rubric.metrics) == 3
         assert rubric.passing_score_threshold == 1
 
-    def test_mandatory_metrics_property(self):
+    def test_evaluation_rubric_extra_fields_forbidden(self):
+        """Test that extra fields are not allowed on a rubric."""
+        with raises_validation_error():
+            EvaluationRubric(
+                rubric_id="test_v1",
+                metrics=[MetricDefinition(id="C1", rubric="Optional 1")],
+                passing_score_threshold=0,
+                extra_field="not allowed",
+            )
+
+    def test_mandatory_metrics_property(self, partitioned_rubric):
         """Test mandatory_metrics property filters correctly."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Mandatory 1", mandatory=True),
-                MetricDefinition(id="M2", rubric="Mandatory 2", mandatory=True),
-                MetricDefinition(id="C1", rubric="Cumulative 1"),
-                MetricDefinition(id="C2", rubric="Cumulative 2"),
-            ],
-            passing_score_threshold=1,
-        )
-        mandatory = rubric.mandatory_metrics
+        mandatory = partitioned_rubric.mandatory_metrics
         assert len(mandatory) == 2
         assert all(m.mandatory for m in mandatory)
         assert {m.id for m in mandatory} == {"M1", "M2"}
+        assert partitioned_rubric.mandatory_ids == frozenset({"M1", "M2"})
 
-    def test_cumulative_metrics_property(self):
+    def test_cumulative_metrics_property(self, partitioned_rubric):
         """Test cumulative_metrics property filters correctly."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Mandatory 1", mandatory=True),
-                MetricDefinition(id="C1", rubric="Cumulative 1"),
-                MetricDefinition(id="C2", rubric="Cumulative 2"),
-                MetricDefinition(id="C3", rubric="Cumulative 3"),
-            ],
-            passing_score_threshold=2,
-        )
-        cumulative = rubric.cumulative_metrics
+        cumulative = partitioned_rubric.cumulative_metrics
         assert len(cumulative) == 3
         assert all(not m.mandatory for m in cumulative)
         assert {m.id for m in cumulative} == {"C1", "C2", "C3"}
+        assert partitioned_rubric.cumulative_ids == frozenset({"C1", "C2", "C3"})
 
     def test_duplicate_metric_ids_rejected(self):
         """Test that duplicate metric IDs are rejected."""
-        with pytest.raises(ValidationError, match="Duplicate metric IDs found: M1"):
+        with raises_validation_error(match="Duplicate metric IDs found: M1"):
             EvaluationRubric(
                 rubric_id="test_v1",
                 metrics=[
@@ -144,62 +226,65 @@ class TestEvaluationRubric:
                 passing_score_threshold=0,
             )
 
+    def test_all_duplicate_metric_ids_reported(self):
+        """Test that every duplicated metric ID is listed once in the error."""
+        with raises_validation_error(match="Duplicate metric IDs found: C1, M1\\."):
+            EvaluationRubric(
+                rubric_id="test_v1",
+                metrics=[
+                    MetricDefinition(id="M1", rubric="First"),
+                    MetricDefinition(id="C1", rubric="Second"),
+                    MetricDefinition(id="M1", rubric="Duplicate"),
+                    MetricDefinition(id="C1", rubric="Duplicate"),
+                    MetricDefinition(id="M1", rubric="Triplicate"),
+                ],
+                passing_score_threshold=0,
+            )
+
+    def test_duplicate_at_end_of_full_rubric_rejected(self):
+        """Test that a single duplicate is found at the end of a 100-metric list."""
+        metrics = [MetricDefinition.build_trusted(f"C{i}", f"Metric {i}") for i in range(99)]
+        metrics.append(MetricDefinition.build_trusted("C0", "Duplicate"))
+        with raises_validation_error(match="Duplicate metric IDs found: C0\\."):
+            EvaluationRubric(
+                rubric_id="test_v1",
+                metrics=metrics,
+                passing_score_threshold=0,
+            )
+
     def test_empty_metrics_list_rejected(self):
         """Test that empty metrics list is rejected."""
-        with pytest.raises(ValidationError, match="Evaluation rubric must contain at least one metric"):
+        with raises_validation_error(match="Evaluation rubric must contain at least one metric"):
             EvaluationRubric(
                 rubric_id="test_v1",
                 metrics=[],
                 passing_score_threshold=0,
             )
 
-    def test_maximum_total_metrics_limit(self):
+    def test_maximum_total_metrics_limit(self, metrics_101):
         """Test that total metrics cannot exceed maximum limit."""
-        # Create 101 metrics (exceeds limit of 100)
-        too_many_metrics = [
-            MetricDefinition(id=f"M{i}", rubric=f"Metric {i}")
-            for i in range(101)
-        ]
-        with pytest.raises(ValidationError, match="Too many metrics: 101 exceeds maximum of 100"):
+        with raises_validation_error(match="Too many metrics: 101 exceeds maximum of 100"):
             EvaluationRubric(
                 rubric_id="test_v1",
-                metrics=too_many_metrics,
+                metrics=metrics_101,
                 passing_score_threshold=0,
             )
 
-    def test_maximum_mandatory_metrics_limit(self):
+    def test_maximum_mandatory_metrics_limit(self, metrics_21_mandatory):
         """Test that mandatory metrics cannot exceed maximum limit."""
-        # Create 21 mandatory metrics (exceeds limit of 20)
-        too_many_mandatory = [
-            MetricDefinition(id=f"M{i}", rubric=f"Mandatory {i}", mandatory=True)
-            for i in range(21)
-        ]
-        with pytest.raises(ValidationError, match="Too many mandatory metrics: 21 exceeds maximum of 20"):
+        with raises_validation_error(match="Too many mandatory metrics: 21 exceeds maximum of 20"):
             EvaluationRubric(
                 rubric_id="test_v1",
-                metrics=too_many_mandatory,
+                metrics=metrics_21_mandatory,
                 passing_score_threshold=0,
             )
 
-    def test_metrics_at_limit_accepted(self):
+    def test_metrics_at_limit_accepted(self, metrics_100_with_20_mandatory):
         """Test that metrics at the limit are accepted."""
-        # Create exactly 100 metrics with 20 mandatory (at limits)
-        metrics_at_limit = []
-        # Add 20 mandatory metrics
-        for i in range(20):
-            metrics_at_limit.append(
-                MetricDefinition(id=f"M{i}", rubric=f"Mandatory {i}", mandatory=True)
-            )
-        # Add 80 cumulative metrics
-        for i in range(20, 100):
-            metrics_at_limit.append(
-                MetricDefinition(id=f"C{i}", rubric=f"Cumulative {i}")
-            )
-
         # This should work without raising an exception
         rubric = EvaluationRubric(
             rubric_id="test_v1",
-            metrics=metrics_at_limit,
+            metrics=metrics_100_with_20_mandatory,
             passing_score_threshold=40,
         )
         assert len(rubric.metrics) == 100
@@ -208,8 +293,8 @@ class TestEvaluationRubric:
 
     def test_threshold_exceeds_cumulative_count_rejected(self):
         """Test that threshold cannot exceed cumulative metric count."""
-        with pytest.raises(
-            ValidationError, match="Invalid passing threshold.*exceeds the number of.*cumulative metrics.*Please set passing_score_threshold"
+        with raises_validation_error(
+            match="Invalid passing threshold.*exceeds the number of.*cumulative metrics.*Please set passing_score_threshold"
         ):
             EvaluationRubric(
                 rubric_id="test_v1",
@@ -221,6 +306,14 @@ class TestEvaluationRubric:
                 passing_score_threshold=3,  # Only 2 cumulative metrics!
             )
 
+    def test_threshold_not_checked_against_invalid_metrics(self):
+        """Test that invalid metrics are reported without a spurious threshold error."""
+        with raises_validation_error() as exc_info:
+            EvaluationRubric(rubric_id="test_v1", metrics=[], passing_score_threshold=1)
+
+        assert exc_info.value.error_count() == 1
+        assert "Invalid passing threshold" not in str(exc_info.value)
+
     def test_threshold_zero_allowed(self):
         """Test that threshold of 0 is allowed."""
         rubric = EvaluationRubric(
@@ -273,23 +366,7 @@ class TestEvaluationRubric:
 
         prompt = rubric.to_prompt_text()
 
-        # Check that all components are present
-        assert "# Evaluation Rubric: code_review_v1" in prompt
-        assert "## Mandatory Criteria (ALL must pass)" in prompt
-        assert "## Cumulative Criteria" in prompt
-        assert "(Must pass at least 2 of 3)" in prompt
-        assert "## Instructions" in prompt
-
-        # Check that all metrics are included
-        assert "**M1**: Code compiles without errors" in prompt
-        assert "**M2**: No security vulnerabilities" in prompt
-        assert "**C1**: Follows style guide" in prompt
-        assert "**C2**: Has unit tests" in prompt
-        assert "**C3**: Well documented" in prompt
-
-        # Check instructions
-        assert "All 2 mandatory criteria must pass" in prompt
-        assert "At least 2 cumulative criteria must pass" in prompt
+        assert_has_lines(prompt, PROMPT_REQUIRED_LINES)
 
     def test_to_prompt_text_only_mandatory(self):
         """Test prompt text with only mandatory metrics."""
@@ -365,121 +442,145 @@ class TestEvaluationRubric:
         assert "M1_reasoning" not in schema["required"]
         assert "C1_reasoning" not in schema["required"]
 
-    def test_validate_result_all_pass(self):
-        """Test validation when all criteria pass."""
+    def test_to_json_schema_modification_is_isolated(self):
+        """Test that modifying a returned schema affects neither the rubric nor equal rubrics."""
+        metrics = [MetricDefinition(id="C1", rubric="Cumulative")]
+        rubric_a = EvaluationRubric(rubric_id="test_v1", metrics=metrics, passing_score_threshold=0)
+        rubric_b = EvaluationRubric(rubric_id="test_v1", metrics=metrics, passing_score_threshold=0)
+
+        schema = rubric_a.to_json_schema()
+        schema["properties"]["X"] = 1
+        schema["properties"]["C1"]["type"] = "string"
+        schema["required"].append("X")
+
+        for fresh in (rubric_a.to_json_schema(), rubric_b.to_json_schema()):
+            assert "X" not in fresh["properties"]
+            assert fresh["properties"]["C1"]["type"] == "boolean"
+            assert fresh["required"] == ["C1"]
+
+    @pytest.mark.parametrize("result,expected", [
+        pytest.param(MIXED_RESULT_PASS, True, id="all_pass"),
+        pytest.param(MIXED_RESULT_MANDATORY_FAIL, False, id="mandatory_fails"),
+        pytest.param(MIXED_RESULT_CUMULATIVE_FAIL, False, id="cumulative_fails"),
+        pytest.param({**MIXED_RESULT_PASS, "M1_reasoning": "It works!", "extra_field": "ignored"},
+                     True, id="ignores_extra_fields"),
+    ])
+    def test_validate_result(self, mixed_rubric, result, expected):
+        """Test pass/fail semantics of mandatory and cumulative metrics on dict results."""
+        assert mixed_rubric.validate_result(result) is expected
+
+    def test_validate_result_zero_threshold_cumulative_only(self):
+        """Test that a zero threshold passes even when all cumulative metrics fail."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
-                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
                 MetricDefinition(id="C1", rubric="Cumulative 1"),
                 MetricDefinition(id="C2", rubric="Cumulative 2"),
             ],
-            passing_score_threshold=1,
+            passing_score_threshold=0,
         )
 
-        result = {"M1": True, "C1": True, "C2": False}
-        assert rubric.validate_result(result) is True
+        assert rubric.validate_result({"C1": False, "C2": False}) is True
+
+        # Values outside the pass/fail rule are still checked
+        with pytest.raises(ValueError, match="Missing evaluation results for 1 metric"):
+            rubric.validate_result({"C1": False})
+        with pytest.raises(ValueError, match="Invalid result for metric 'C2'"):
+            rubric.validate_result({"C1": False, "C2": 0})
 
-    def test_validate_result_mandatory_fails(self):
-        """Test validation when mandatory metric fails."""
+    def test_validate_result_large_rubric_threshold_boundary(self):
+        """Test threshold boundary on a rubric wider than a 64-bit word."""
+        metrics = [MetricDefinition(id=f"M{i}", rubric=f"Mandatory {i}", mandatory=True) for i in range(5)]
+        metrics += [MetricDefinition(id=f"C{i}", rubric=f"Cumulative {i}") for i in range(75)]
         rubric = EvaluationRubric(
             rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
-                MetricDefinition(id="C1", rubric="Cumulative 1"),
-            ],
-            passing_score_threshold=0,
+            metrics=metrics,
+            passing_score_threshold=40,
         )
 
-        result = {"M1": False, "C1": True}
-        assert rubric.validate_result(result) is False
+        # Exactly 40 of the 75 cumulative metrics pass
+        result = dict.fromkeys([m.id for m in metrics], True)
+        result.update(dict.fromkeys([f"C{i}" for i in range(40, 75)], False))
+        assert rubric.validate_result(result) is True
 
-    def test_validate_result_cumulative_fails(self):
-        """Test validation when cumulative threshold not met."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
-                MetricDefinition(id="C1", rubric="Cumulative 1"),
-                MetricDefinition(id="C2", rubric="Cumulative 2"),
-                MetricDefinition(id="C3", rubric="Cumulative 3"),
-            ],
-            passing_score_threshold=2,
-        )
+        result["C0"] = False
+        assert rubric.validate_result(result) is False
 
-        result = {"M1": True, "C1": True, "C2": False, "C3": False}
+        result["C0"] = True
+        result["M4"] = False
         assert rubric.validate_result(result) is False
 
-    def test_validate_result_missing_metric(self):
-        """Test validation fails when metric is missing."""
+    @pytest.mark.parametrize("payload,expected", [
+        pytest.param('{"M1": true, "C1": true, "C2": false}', True, id="json_string_pass"),
+        pytest.param('{"M1": false, "C1": true, "C2": true}', False, id="json_string_fail"),
+        pytest.param('{"M1": true, "C1": true, "C2": true, "M1_reasoning": "Looks good"}', True,
+                     id="json_string_with_reasoning"),
+        pytest.param(b'{"M1": true, "C1": false, "C2": true}', True, id="json_bytes_pass"),
+        pytest.param(b'{"M1": false, "C1": true, "C2": true}', False, id="json_bytes_fail"),
+    ])
+    def test_validate_result_json(self, mixed_rubric, payload, expected):
+        """Test validation of JSON strings and UTF-8 encoded JSON bytes."""
+        assert mixed_rubric.validate_result(payload) is expected
+
+    @pytest.mark.parametrize("payload,message", [
+        pytest.param({"M1": True, "M2": True, "C1": True, "C2": True},
+                     r"Missing evaluation results for 1 metric\(s\):\n  Cumulative: C3\n",
+                     id="missing_metric"),
+        pytest.param({"C1": True, "C2": True},
+                     r"Missing evaluation results for 3 metric\(s\):\n  Mandatory: M1, M2\n  Cumulative: C3\n",
+                     id="missing_multiple_metrics"),
+        pytest.param({"M1": "yes", "M2": True, "C1": True, "C2": True, "C3": True},
+                     "Invalid result for metric 'M1': expected boolean, got str", id="invalid_type"),
+        pytest.param('{"M1": true', "Invalid JSON string", id="invalid_json"),
+        pytest.param('[{"M1": true}]', "must be a JSON string or dictionary", id="json_array"),
+        pytest.param(123, "must be a JSON string or dictionary", id="non_string_non_dict"),
+    ])
+    def test_validate_result_rejects(self, partitioned_rubric, payload, message):
+        """Test validation fails for missing metrics, non-boolean values, malformed JSON and unsupported types."""
+        with pytest.raises(ValueError, match=message):
+            partitioned_rubric.validate_result(payload)
+
+    def test_validate_and_return(self):
+        """Test validate_and_return() builds a validated result model."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
                 MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
                 MetricDefinition(id="C1", rubric="Cumulative"),
             ],
-            passing_score_threshold=0,
-        )
-
-        result = {"M1": True}  # Missing C1
-        with pytest.raises(ValueError) as exc_info:
-            rubric.validate_result(result)
-
-        error_msg = str(exc_info.value)
-        assert "Missing evaluation results for 1 metric(s)" in error_msg
-        assert "Cumulative: C1" in error_msg
-
-    def test_validate_result_missing_multiple_metrics(self):
-        """Test enhanced error message for multiple missing metrics."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Mandatory 1", mandatory=True),
-                MetricDefinition(id="M2", rubric="Mandatory 2", mandatory=True),
-                MetricDefinition(id="C1", rubric="Cumulative 1"),
-                MetricDefinition(id="C2", rubric="Cumulative 2"),
-            ],
-            passing_score_threshold=0,
+            passing_score_threshold=1,
         )
+        ResultModel = rubric.to_pydantic_model()
 
-        result = {"C1": True}  # Missing M1, M2, C2
-        with pytest.raises(ValueError) as exc_info:
-            rubric.validate_result(result)
+        from_json = rubric.validate_and_return('{"M1": true, "C1": false, "C1_reasoning": "Missing"}')
+        assert isinstance(from_json, ResultModel)
+        assert from_json.passes() is False
+        assert from_json.C1_reasoning == "Missing"
 
-        error_msg = str(exc_info.value)
-        assert "Missing evaluation results for 3 metric(s)" in error_msg
-        assert "Mandatory: M1, M2" in error_msg
-        assert "Cumulative: C2" in error_msg
+        from_dict = rubric.validate_and_return({"M1": True, "C1": True})
+        assert from_dict.passes() is True
 
-    def test_validate_result_invalid_type(self):
-        """Test validation fails when metric value is not boolean."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test validation check with a long description", mandatory=True),
-            ],
-            passing_score_threshold=0,
-        )
+        with raises_validation_error():
+            rubric.validate_and_return('{"M1": true}')  # Missing C1
 
-        result = {"M1": "yes"}  # String instead of boolean
-        with pytest.raises(ValueError, match="Invalid result for metric 'M1': expected boolean, got str"):
-            rubric.validate_result(result)
+    def test_decode_results(self, mixed_rubric, mixed_result_model):
+        """Test bulk parsing of a JSON array into result models."""
+        raw = b'[{"M1": true, "C1": true, "C2": false}, {"M1": false, "C1": true, "C2": true, "M1_reasoning": "No"}]'
+        results = mixed_rubric.decode_results(raw)
 
-    def test_validate_result_ignores_extra_fields(self):
-        """Test that validation allows extra fields like reasoning."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test", mandatory=True),
-            ],
-            passing_score_threshold=0,
-        )
+        assert all(type(result) is mixed_result_model for result in results)
+        assert [result.passes() for result in results] == [True, False]
+        assert results[1].M1_reasoning == "No"
+        assert mixed_rubric.decode_results(raw.decode()) == results
+        assert mixed_rubric.decode_results("[]") == []
 
-        result = {"M1": True, "M1_reasoning": "It works!", "extra_field": "ignored"}
-        assert rubric.validate_result(result) is True
+        with raises_validation_error(match=r"1\.C2"):
+            mixed_rubric.decode_results('[{"M1": true, "C1": true, "C2": false}, {"M1": true, "C1": true}]')
+        with raises_validation_error():
+            mixed_rubric.decode_results('{"M1": true, "C1": true, "C2": false}')
 
-    def test_validate_result_json_string_pass(self):
-        """Test validation with JSON string that passes."""
+    def test_validate_results_batch(self):
+        """Test batch validation of mixed JSON strings and dictionaries."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
@@ -489,38 +590,17 @@ class TestEvaluationRubric:
             passing_score_threshold=1,
         )
 
-        json_result = '{"M1": true, "C1": true}'
-        assert rubric.validate_result(json_result) is True
-
-    def test_validate_result_json_string_fail(self):
-        """Test validation with JSON string that fails."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
-                MetricDefinition(id="C1", rubric="Cumulative"),
-            ],
-            passing_score_threshold=1,
-        )
-
-        json_result = '{"M1": false, "C1": true}'
-        assert rubric.validate_result(json_result) is False
-
-    def test_validate_result_json_string_with_reasoning(self):
-        """Test validation with JSON string including reasoning fields."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test", mandatory=True),
-            ],
-            passing_score_threshold=0,
-        )
-
-        json_result = '{"M1": true, "M1_reasoning": "Looks good"}'
-        assert rubric.validate_result(json_result) is True
+        results = [
+            '{"M1": true, "C1": true}',
+            '{"M1": false, "C1": true}',
+            {"M1": True, "C1": False},
+            {"M1": True, "C1": True, "M1_reasoning": "Fine"},
+        ]
+        assert rubric.validate_results_batch(results) == [True, False, False, True]
+        assert rubric.validate_results_batch([]) == []
 
-    def test_validate_result_invalid_json(self):
-        """Test validation fails with malformed JSON."""
+    def test_validate_results_batch_rejects_invalid_item(self):
+        """Test batch validation raises on the first malformed result."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
@@ -529,89 +609,28 @@ class TestEvaluationRubric:
             passing_score_threshold=0,
         )
 
-        invalid_json = '{"M1": true'  # Missing closing brace
         with pytest.raises(ValueError, match="Invalid JSON string"):
-            rubric.validate_result(invalid_json)
-
-    def test_validate_result_json_array_rejected(self):
-        """Test validation fails when JSON is an array instead of object."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test", mandatory=True),
-            ],
-            passing_score_threshold=0,
-        )
-
-        json_array = '[{"M1": true}]'
-        with pytest.raises(ValueError, match="must be a JSON string or dictionary"):
-            rubric.validate_result(json_array)
-
-    def test_validate_result_non_string_non_dict_rejected(self):
-        """Test validation fails when result is neither string nor dict."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test", mandatory=True),
-            ],
-            passing_score_threshold=0,
-        )
-
-        with pytest.raises(ValueError, match="must be a JSON string or dictionary"):
-            rubric.validate_result(123)
+            rubric.validate_results_batch(['{"M1": true}', '{"M1": true'])
 
-    def test_generate_report_basic(self):
+    def test_generate_report_basic(self, mixed_rubric):
         """Test basic report generation with mixed metrics."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Mandatory check", mandatory=True),
-                MetricDefinition(id="C1", rubric="Cumulative check 1"),
-                MetricDefinition(id="C2", rubric="Cumulative check 2"),
-            ],
-            passing_score_threshold=1,
-        )
-
-        result = {"M1": True, "C1": True, "C2": False}
-        report = rubric.generate_report(result)
+        report = mixed_rubric.generate_report(MIXED_RESULT_PASS)
 
         # Check basic structure
-        assert "# Evaluation Report: test_v1" in report
-        assert "**Overall Result: PASS**" in report
-        assert "## Mandatory Criteria (ALL must pass)" in report
-        assert "## Cumulative Criteria" in report
+        assert_has_lines(report, REPORT_REQUIRED_LINES)
         assert "**Score: 1/2**" in report
-        assert "## Requirements for Passing" in report
 
-    def test_generate_report_with_reasoning(self):
+    def test_generate_report_with_reasoning(self, single_mandatory_rubric):
         """Test report generation includes reasoning."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test metric", mandatory=True),
-            ],
-            passing_score_threshold=0,
-        )
-
-        result = {"M1": True}
         reasoning = {"M1": "This is the reason it passed"}
-        report = rubric.generate_report(result, reasoning)
+        report = single_mandatory_rubric.generate_report(SINGLE_RESULT_PASS, reasoning)
 
         assert "This is the reason it passed" in report
         assert "→" in report
 
-    def test_generate_report_custom_title(self):
+    def test_generate_report_custom_title(self, single_mandatory_rubric):
         """Test report generation with custom title."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test", mandatory=True),
-            ],
-            passing_score_threshold=0,
-        )
-
-        result = {"M1": True}
-        report = rubric.generate_report(result, title="My Custom Report")
+        report = single_mandatory_rubric.generate_report(SINGLE_RESULT_PASS, title="My Custom Report")
 
         assert "# My Custom Report" in report
         assert "# Evaluation Report: test_v1" not in report
@@ -651,9 +670,11 @@ class TestEvaluationRubric:
         result = {"M1": True, "C1": True, "M2": False}
         report = rubric.generate_report(result)
 
-        assert "**Overall Result: FAIL**" in report
-        assert "⚠️  **1 mandatory metric(s) failed:** M2" in report
-        assert "✗ **M2** [FAIL]" in report
+        assert_contains_all(report, [
+            "**Overall Result: FAIL**",
+            "⚠️  **1 mandatory metric(s) failed:** M2",
+            "✗ **M2** [FAIL]",
+        ])
 
     def test_generate_report_cumulative_fails(self):
         """Test report shows cumulative score deficit."""
@@ -671,10 +692,12 @@ class TestEvaluationRubric:
         result = {"M1": True, "C1": True, "C2": False, "C3": False}
         report = rubric.generate_report(result)
 
-        assert "**Overall Result: FAIL**" in report
-        assert "**Score: 1/3**" in report
-        assert "⚠️  **Need 2 more cumulative metric(s) to pass**" in report
-        assert "Still need: 2 more" in report
+        assert_contains_all(report, [
+            "**Overall Result: FAIL**",
+            "**Score: 1/3**",
+            "⚠️  **Need 2 more cumulative metric(s) to pass**",
+            "Still need: 2 more",
+        ])
 
     def test_generate_report_only_mandatory(self):
         """Test report with only mandatory metrics."""
@@ -712,164 +735,281 @@ class TestEvaluationRubric:
         assert "## Cumulative Criteria" in report
         assert "**Score: 1/2**" in report
 
-    def test_to_pydantic_model_basic(self):
-        """Test Pydantic model generation."""
+    def test_generate_reports_batch(self):
+        """Test batch reports match individually generated reports."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
-                MetricDefinition(id="M1", rubric="First check", mandatory=True),
-                MetricDefinition(id="C1", rubric="Second check"),
+                MetricDefinition(id="M1", rubric="Mandatory 1", mandatory=True),
+                MetricDefinition(id="C1", rubric="Cumulative 1"),
+                MetricDefinition(id="C2", rubric="Cumulative 2"),
             ],
-            passing_score_threshold=0,
+            passing_score_threshold=2,
         )
 
+        results = [
+            {"M1": True, "C1": True, "C2": True},
+            {"M1": False, "C1": True, "C2": False},
+        ]
+        reasonings = [{"M1": "Looks good"}, None]
+        reports = rubric.generate_reports_batch(results, reasonings, title="Batch")
+
+        assert reports == [
+            rubric.generate_report(results[0], reasonings[0], "Batch"),
+            rubric.generate_report(results[1], None, "Batch"),
+        ]
+
+        # Result models supply their own reasoning fields
         ResultModel = rubric.to_pydantic_model()
+        model = ResultModel(M1=True, M1_reasoning="Compiles", C1=False, C2=True)
+        assert rubric.generate_reports_batch([model]) == [model.to_report()]
+
+        with pytest.raises(ValueError, match="Expected 2 reasoning entries"):
+            rubric.generate_reports_batch(results, [None])
 
+    def test_to_pydantic_model_basic(self, mixed_result_model):
+        """Test Pydantic model generation."""
         # Check the model class name
-        assert ResultModel.__name__ == "EvaluationResult_test_v1"
+        assert mixed_result_model.__name__ == "EvaluationResult_test_v1"
 
         # Create a valid instance
-        result = ResultModel(M1=True, C1=False)
+        result = mixed_result_model(M1=True, C1=False, C2=True)
         assert result.M1 is True
         assert result.C1 is False
+        assert result.C2 is True
 
-    def test_to_pydantic_model_with_reasoning(self):
+    def test_to_pydantic_model_with_reasoning(self, mixed_result_model):
         """Test Pydantic model with reasoning fields."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test", mandatory=True),
-            ],
-            passing_score_threshold=0,
-        )
-
-        ResultModel = rubric.to_pydantic_model()
-
         # Create instance with reasoning
-        result = ResultModel(M1=True, M1_reasoning="Looks good!")
+        result = mixed_result_model(M1=True, C1=True, C2=True, M1_reasoning="Looks good!")
         assert result.M1 is True
         assert result.M1_reasoning == "Looks good!"
 
-    def test_to_pydantic_model_validation_required_fields(self):
+    def test_to_pydantic_model_validation_required_fields(self, mixed_result_model):
         """Test that Pydantic model enforces required fields."""
-        rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test 1"),
-                MetricDefinition(id="M2", rubric="Test 2"),
-            ],
-            passing_score_threshold=0,
-        )
-
-        ResultModel = rubric.to_pydantic_model()
-
         # Missing required field should raise error
-        with pytest.raises(ValidationError):
-            ResultModel(M1=True)  # Missing M2
+        with raises_validation_error():
+            mixed_result_model(M1=True, C1=True)  # Missing C2
 
-    def test_to_pydantic_model_validation_type_checking(self):
+    def test_to_pydantic_model_validation_type_checking(self, mixed_result_model):
         """Test that Pydantic model enforces type checking."""
+        # Invalid type should raise error
+        with raises_validation_error():
+            mixed_result_model(M1=123, C1=True, C2=True)  # Should be boolean
+
+        # Also test with dict - Pydantic coerces some strings but not all
+        with raises_validation_error():
+            mixed_result_model(M1=None, C1=True, C2=True)  # Should be boolean, not None
+
+    def test_to_pydantic_model_extra_fields_forbidden(self, mixed_result_model):
+        """Test that Pydantic model forbids extra fields."""
+        # Extra fields should raise error
+        with raises_validation_error():
+            mixed_result_model(M1=True, C1=True, C2=True, extra_field="not allowed")
+
+    def test_to_pydantic_model_json_parsing(self, mixed_result_model):
+        """Test that Pydantic model can parse JSON."""
+        # Parse from JSON string
+        json_data = '{"M1": true, "C1": false, "C2": true, "M1_reasoning": "Good"}'
+        result = mixed_result_model.model_validate_json(json_data)
+
+        assert result.M1 is True
+        assert result.C1 is False
+        assert result.M1_reasoning == "Good"
+
+    def test_to_pydantic_model_dict_export(self, mixed_result_model):
+        """Test that Pydantic model can export to dict."""
+        result = mixed_result_model(M1=True, C1=True, C2=True, M1_reasoning="Good")
+
+        # Export to dict
+        result_dict = result.model_dump()
+        assert result_dict["M1"] is True
+        assert result_dict["M1_reasoning"] == "Good"
+
+        # Export to dict excluding None values
+        result2 = mixed_result_model(M1=False, C1=True, C2=True)
+        result_dict2 = result2.model_dump(exclude_none=True)
+        assert "M1_reasoning" not in result_dict2
+
+    def test_to_pydantic_model_json_schema_compatibility(self, mixed_rubric, mixed_result_model):
+        """Test that Pydantic model schema matches to_json_schema()."""
+        # Get both schemas
+        json_schema = mixed_rubric.to_json_schema()
+        pydantic_schema = mixed_result_model.model_json_schema()
+
+        # Check that required fields match
+        assert set(json_schema["required"]) == set(pydantic_schema["required"])
+
+        # Check that all metric fields are present in both
+        for metric in mixed_rubric.metrics:
+            assert metric.id in json_schema["properties"]
+            assert metric.id in pydantic_schema["properties"]
+
+    def test_result_model_json_schema_cached(self, mixed_result_model):
+        """Test that the generated model's default JSON schema is built once and copied out."""
+        schema = mixed_result_model.model_json_schema()
+        assert schema["title"] == "EvaluationResult_test_v1"
+
+        # Callers may modify the returned schema without affecting later calls
+        schema.pop("title")
+        schema["properties"]["M1"]["type"] = "string"
+        fresh = mixed_result_model.model_json_schema()
+        assert fresh["title"] == "EvaluationResult_test_v1"
+        assert fresh["properties"]["M1"]["type"] == "boolean"
+
+        # Non-default arguments still generate a fresh schema
+        serialization = mixed_result_model.model_json_schema(mode="serialization")
+        assert serialization is not schema
+        assert set(serialization["properties"]) == set(schema["properties"])
+
+    def test_generated_artifacts_are_cached(self):
+        """Test that prompt text, JSON schema and result model are built once."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
-                MetricDefinition(id="M1", rubric="Test"),
+                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+                MetricDefinition(id="C1", rubric="Cumulative"),
             ],
-            passing_score_threshold=0,
+            passing_score_threshold=1,
         )
 
-        ResultModel = rubric.to_pydantic_model()
+        assert rubric.to_pydantic_model() is rubric.to_pydantic_model()
+        # The schema is cached, but every call returns an independent copy
+        schema = rubric.to_json_schema()
+        assert rubric.to_json_schema() == schema
+        assert rubric.to_json_schema() is not schema
+        assert rubric.to_prompt_text() is rubric.to_prompt_text()
+        assert rubric.mandatory_metrics is rubric.mandatory_metrics
+        assert rubric.cumulative_metrics is rubric.cumulative_metrics
+
+    def test_result_model_shared_between_identical_rubrics(self):
+        """Test that equal rubrics share one frozen result model class."""
+        def make_rubric(threshold):
+            return EvaluationRubric(
+                rubric_id="test_v1",
+                metrics=[
+                    MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+                    MetricDefinition(id="C1", rubric="Cumulative"),
+                ],
+                passing_score_threshold=threshold,
+            )
 
-        # Invalid type should raise error
-        with pytest.raises(ValidationError):
-            ResultModel(M1=123)  # Should be boolean
+        ResultModel = make_rubric(1).to_pydantic_model()
+        assert make_rubric(1).to_pydantic_model() is ResultModel
+        assert make_rubric(0).to_pydantic_model() is not ResultModel
+        # The JSON Schema does not depend on the threshold
+        assert make_rubric(0).to_json_schema() == make_rubric(1).to_json_schema()
 
-        # Also test with dict - Pydantic coerces some strings but not all
-        with pytest.raises(ValidationError):
-            ResultModel(M1=None)  # Should be boolean, not None
+        result = ResultModel(M1=True, C1=False)
+        with raises_validation_error():
+            result.M1 = False
+        assert len({result, ResultModel(M1=True, C1=False)}) == 1
 
-    def test_to_pydantic_model_extra_fields_forbidden(self):
-        """Test that Pydantic model forbids extra fields."""
+    def test_result_model_released_with_rubric(self):
+        """Test that the shared result model cache does not pin classes."""
         rubric = EvaluationRubric(
-            rubric_id="test_v1",
-            metrics=[
-                MetricDefinition(id="M1", rubric="Test"),
-            ],
+            rubric_id="test_released",
+            metrics=[MetricDefinition(id="C1", rubric="Cumulative")],
             passing_score_threshold=0,
         )
+        model_ref = weakref.ref(rubric.to_pydantic_model())
 
-        ResultModel = rubric.to_pydantic_model()
-
-        # Extra fields should raise error
-        with pytest.raises(ValidationError):
-            ResultModel(M1=True, extra_field="not allowed")
+        del rubric
+        gc.collect()
+        assert model_ref() is None
 
-    def test_to_pydantic_model_json_parsing(self):
-        """Test that Pydantic model can parse JSON."""
+    def test_rubric_is_frozen(self):
+        """Test that rubric fields cannot be reassigned after construction."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
-                MetricDefinition(id="M1", rubric="Test"),
-                MetricDefinition(id="C1", rubric="Test 2"),
+                MetricDefinition(id="C1", rubric="Cumulative"),
             ],
-            passing_score_threshold=1,
+            passing_score_threshold=0,
         )
 
-        ResultModel = rubric.to_pydantic_model()
+        with raises_validation_error():
+            rubric.passing_score_threshold = 1
 
-        # Parse from JSON string
-        json_data = '{"M1": true, "C1": false, "M1_reasoning": "Good"}'
-        result = ResultModel.model_validate_json(json_data)
+    def test_metrics_stored_as_tuple(self):
+        """Test that metrics are stored as a tuple, so rubrics are hashable."""
+        metrics = [
+            MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+            MetricDefinition(id="C1", rubric="Cumulative"),
+        ]
+        rubric = EvaluationRubric(rubric_id="test_v1", metrics=metrics, passing_score_threshold=1)
+        same = EvaluationRubric(rubric_id="test_v1", metrics=tuple(metrics), passing_score_threshold=1)
 
-        assert result.M1 is True
-        assert result.C1 is False
-        assert result.M1_reasoning == "Good"
+        assert isinstance(rubric.metrics, tuple)
+        assert rubric == same
+        assert hash(rubric) == hash(same)
 
-    def test_to_pydantic_model_dict_export(self):
-        """Test that Pydantic model can export to dict."""
+        copied = rubric.model_copy(update={"metrics": metrics[:1], "passing_score_threshold": 0})
+        assert isinstance(copied.metrics, tuple)
+
+    def test_pickle_round_trip(self, mixed_rubric):
+        """Test that a used rubric pickles and behaves the same after loading."""
+        mixed_rubric.to_pydantic_model()
+        mixed_rubric.to_json_schema()
+        mixed_rubric.validate_result(MIXED_RESULT_PASS)
+
+        restored = pickle.loads(pickle.dumps(mixed_rubric))
+
+        assert restored == mixed_rubric
+        assert restored.to_prompt_text() == mixed_rubric.to_prompt_text()
+        assert restored.validate_result(MIXED_RESULT_PASS) is True
+        assert restored.validate_result(MIXED_RESULT_MANDATORY_FAIL) is False
+        assert restored.to_pydantic_model() is mixed_rubric.to_pydantic_model()
+
+    def test_instances_not_copied_on_validation(self):
+        """Test that metrics and rubrics are reused, not copied, by validation."""
+        metric = MetricDefinition(id="C1", rubric="Cumulative")
+        rubric = EvaluationRubric(rubric_id="test_v1", metrics=[metric], passing_score_threshold=0)
+        assert rubric.metrics[0] is metric
+
+        class Config(BaseModel):
+            rubric: EvaluationRubric
+
+        assert Config(rubric=rubric).rubric is rubric
+
+    def test_model_copy_update_rebuilds_cached_state(self):
+        """Test that model_copy(update=...) does not reuse stale caches."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
-                MetricDefinition(id="M1", rubric="Test"),
+                MetricDefinition(id="C1", rubric="Cumulative 1"),
+                MetricDefinition(id="C2", rubric="Cumulative 2"),
             ],
-            passing_score_threshold=0,
+            passing_score_threshold=1,
         )
+        result = {"C1": True, "C2": False}
+        assert rubric.validate_result(result) is True
+        rubric.to_prompt_text()
 
-        ResultModel = rubric.to_pydantic_model()
-        result = ResultModel(M1=True, M1_reasoning="Good")
+        stricter = rubric.model_copy(update={"passing_score_threshold": 2})
 
-        # Export to dict
-        result_dict = result.model_dump()
-        assert result_dict["M1"] is True
-        assert result_dict["M1_reasoning"] == "Good"
-
-        # Export to dict excluding None values
-        result2 = ResultModel(M1=False)
-        result_dict2 = result2.model_dump(exclude_none=True)
-        assert "M1_reasoning" not in result_dict2
+        assert stricter.validate_result(result) is False
+        assert "(Must pass at least 2 of 2)" in stricter.to_prompt_text()
+        assert stricter.to_pydantic_model() is not rubric.to_pydantic_model()
+        assert stricter == rubric.model_copy(update={"passing_score_threshold": 2})
 
-    def test_to_pydantic_model_json_schema_compatibility(self):
-        """Test that Pydantic model schema matches to_json_schema()."""
+    def test_model_copy_update_is_validated(self):
+        """Test that model_copy(update=...) rejects values the constructor rejects."""
         rubric = EvaluationRubric(
             rubric_id="test_v1",
             metrics=[
-                MetricDefinition(id="M1", rubric="First check"),
-                MetricDefinition(id="C1", rubric="Second check"),
+                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+                MetricDefinition(id="C1", rubric="Cumulative"),
             ],
-            passing_score_threshold=0,
+            passing_score_threshold=1,
         )
 
-        # Get both schemas
-        json_schema = rubric.to_json_schema()
-        ResultModel = rubric.to_pydantic_model()
-        pydantic_schema = ResultModel.model_json_schema()
-
-        # Check that required fields match
-        assert set(json_schema["required"]) == set(pydantic_schema["required"])
-
-        # Check that all metric fields are present in both
-        for metric in rubric.metrics:
-            assert metric.id in json_schema["properties"]
-            assert metric.id in pydantic_schema["properties"]
+        with raises_validation_error(match="Invalid passing threshold"):
+            rubric.model_copy(update={"passing_score_threshold": 5})
+        with raises_validation_error(match="Duplicate metric IDs found: C1"):
+            rubric.model_copy(update={"metrics": rubric.metrics + (MetricDefinition(id="C1", rubric="Again"),)})
+        with raises_validation_error():
+            rubric.model_copy(update={"unknown_field": 1})
 
     def test_to_pydantic_model_with_validate_result(self):
         """Test that Pydantic model output works with validate_result()."""
@@ -898,6 +1038,93 @@ class TestEvaluationRubric:
         # Should fail validation (mandatory metric failed)
         assert rubric.validate_result(result_dict2) is False
 
+    def test_validate_result_model_instance(self, mixed_rubric, mixed_result_model, single_mandatory_rubric):
+        """Test that result model instances are validated without model_dump()."""
+        passing = mixed_result_model(**MIXED_RESULT_PASS, M1_reasoning="Fine")
+        failing = mixed_result_model(**MIXED_RESULT_MANDATORY_FAIL)
+
+        assert mixed_rubric.validate_result(passing) is True
+        assert mixed_rubric.validate_result(failing) is False
+        assert mixed_rubric.validate_results_batch([passing, failing]) == [True, False]
+
+        # A model generated for another rubric lacks this rubric's metrics
+        other = single_mandatory_rubric.build_result(SINGLE_RESULT_PASS)
+        with pytest.raises(ValueError, match="Missing evaluation results for 2 metric"):
+            mixed_rubric.validate_result(other)
+
+    def test_find_keys_in_text(self):
+        """Test locating metric IDs mentioned in free text."""
+        rubric = EvaluationRubric(
+            rubric_id="test_v1",
+            metrics=[
+                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+                MetricDefinition(id="C1", rubric="Cumulative 1"),
+                MetricDefinition(id="code_style", rubric="Cumulative 2"),
+            ],
+            passing_score_threshold=1,
+        )
+
+        text = "- **M1**: yes\n- code_style: no\n- M10 and xC1 are not metrics"
+        assert rubric.find_keys_in_text(text) == {"M1", "code_style"}
+        assert rubric.find_keys_in_text("") == set()
+
+    def test_build_trusted_rubric(self):
+        """Test a rubric built without validation behaves like a validated one."""
+        metrics = [
+            MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+            MetricDefinition(id="C1", rubric="Cumulative 1"),
+            MetricDefinition(id="C2", rubric="Cumulative 2"),
+        ]
+        trusted = EvaluationRubric.build_trusted("test_v1", metrics, 1)
+        validated = EvaluationRubric(rubric_id="test_v1", metrics=metrics, passing_score_threshold=1)
+
+        assert trusted == validated
+        assert trusted.to_prompt_text() == validated.to_prompt_text()
+        assert trusted.validate_result({"M1": True, "C1": False, "C2": True}) is True
+        assert trusted.validate_result({"M1": True, "C1": False, "C2": False}) is False
+
+    def test_validate_result_trusted(self):
+        """Test the trusted fast path agrees with validate_result."""
+        rubric = EvaluationRubric(
+            rubric_id="test_v1",
+            metrics=[
+                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+                MetricDefinition(id="C1", rubric="Cumulative 1"),
+                MetricDefinition(id="C2", rubric="Cumulative 2"),
+            ],
+            passing_score_threshold=1,
+        )
+
+        ResultModel = rubric.to_pydantic_model()
+        for values in [(True, True, False), (True, False, False), (False, True, True)]:
+            result = ResultModel(**dict(zip(["M1", "C1", "C2"], values))).model_dump()
+            assert rubric.validate_result_trusted(result) == rubric.validate_result(result)
+
+    def test_build_result(self):
+        """Test build_result() with and without validation."""
+        rubric = EvaluationRubric(
+            rubric_id="test_v1",
+            metrics=[
+                MetricDefinition(id="M1", rubric="Mandatory", mandatory=True),
+                MetricDefinition(id="C1", rubric="Cumulative"),
+            ],
+            passing_score_threshold=1,
+        )
+        ResultModel = rubric.to_pydantic_model()
+
+        validated = rubric.build_result({"M1": True, "C1": True, "M1_reasoning": "Good"})
+        assert isinstance(validated, ResultModel)
+        assert validated.passes() is True
+        assert validated.M1_reasoning == "Good"
+
+        trusted = rubric.build_result({"M1": True, "C1": False}, validate=False)
+        assert isinstance(trusted, ResultModel)
+        assert trusted.passes() is False
+        assert trusted.C1_reasoning is None
+
+        with raises_validation_error():
+            rubric.build_result({"M1": True})  # Missing C1
+
     def test_pydantic_model_get_failed_metrics(self):
         """Test get_failed_metrics() helper method."""
         rubric = EvaluationRubric(
@@ -1148,6 +1375,37 @@ class TestAlignmentCalculation:
         alignment = rubric.calculate_alignment(results_a, results_b)
         assert alignment == 0.75  # 3 out of 4 aligned
 
+    def test_batch_alignment_with_trusted_results(self, mixed_rubric):
+        """Test that results built without validation align like validated ones."""
+        rows_a = [MIXED_RESULT_PASS, MIXED_RESULT_MANDATORY_FAIL, MIXED_RESULT_PASS, MIXED_RESULT_CUMULATIVE_FAIL]
+        rows_b = [MIXED_RESULT_PASS, MIXED_RESULT_CUMULATIVE_FAIL, MIXED_RESULT_MANDATORY_FAIL, MIXED_RESULT_PASS]
+
+        validated = mixed_rubric.calculate_alignment(
+            [mixed_rubric.build_result(row) for row in rows_a],
+            [mixed_rubric.build_result(row) for row in rows_b],
+        )
+        trusted = mixed_rubric.calculate_alignment(
+            [mixed_rubric.build_result(row, validate=False) for row in rows_a],
+            [mixed_rubric.build_result(row, validate=False) for row in rows_b],
+        )
+        assert trusted == validated == 0.5
+
+    def test_batch_alignment_with_results_of_other_rubric(self):
+        """Test that results of another rubric are scored by their own rubric."""
+        metrics = [
+            MetricDefinition(id="C1", rubric="Cumulative 1"),
+            MetricDefinition(id="C2", rubric="Cumulative 2"),
+        ]
+        lenient = EvaluationRubric(rubric_id="test_v1", metrics=metrics, passing_score_threshold=0)
+        strict = EvaluationRubric(rubric_id="test_v1", metrics=metrics, passing_score_threshold=1)
+        row = {"C1": False, "C2": False}
+        x = lenient.build_result(row)
+        y = strict.build_result(row)
+
+        assert strict.calculate_alignment([x], [y]) == 0.0
+        assert strict.calculate_alignment([x, x], [y, y]) == 0.0
+        assert strict.calculate_alignment([x, y], [x, y]) == 1.0
+
     def test_empty_lists(self):
         """Test alignment with empty lists."""
         rubric = EvaluationRubric(
@@ -1,6 +1,9 @@
 """Trivial LLM eval - as simple as possible."""
 
-from teval.metrics import EvaluationRubric, MetricDefinition
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from teval.metrics import EvaluationRubric, MetricDefinition
 
 __version__ = "0.1.1"
 
@@ -9,3 +12,21 @@ __all__ = [
     "MetricDefinition",
     "__version__",
 ]
+
+# Public names resolved from teval.metrics on first access (PEP 562), so
+# importing the package does not pull in pydantic until it is needed
+_LAZY_EXPORTS = frozenset({"EvaluationRubric", "MetricDefinition"})
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        from teval import metrics
+
+        value = getattr(metrics, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY_EXPORTS)
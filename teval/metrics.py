@@ -67,10 +67,179 @@ This design prioritizes simplicity and interpretability over complex
 weighted scoring systems.
 """
 
-import json
+import copy
+import functools
 import keyword
-from typing import List, Dict, Any, Union, Optional, Type
-from pydantic import BaseModel, ConfigDict, Field, field_validator, ValidationInfo, create_model
+import operator
+import re
+import sys
+import weakref
+from typing import List, Dict, Any, Callable, FrozenSet, Sequence, Set, Tuple, Union, Optional, Type
+from pydantic import (
+    BaseModel, ConfigDict, Field, StrictBool, TypeAdapter, ValidationError,
+    create_model, field_validator, model_validator,
+)
+from pydantic_core import from_json
+# Pydantic rejects typing.TypedDict on Python < 3.12
+from typing_extensions import TypedDict
+
+
+# Result model classes shared between rubrics with identical definitions,
+# keyed by _result_model_key(). Each rubric holds a strong reference to its
+# class, so an entry lives exactly as long as some rubric (or caller) uses it.
+_result_model_cache: "weakref.WeakValueDictionary[tuple, Type[BaseModel]]" = weakref.WeakValueDictionary()
+
+
+# Identifier-like tokens; metric IDs are identifiers, so every occurrence of
+# an ID delimited by non-word characters is exactly one of these tokens.
+_WORD_RE = re.compile(r"\w+")
+
+# Opening lines of the instructions section of to_prompt_text(), shared by
+# all rubrics.
+_PROMPT_INSTRUCTIONS = (
+    "## Instructions",
+    "For each criterion above, evaluate whether it passes (Yes) or fails (No).",
+)
+
+
+def _tuple_getter(getter_factory: Callable[..., Callable[[Any], Any]], keys: Tuple[str, ...]) -> Callable[[Any], Tuple[Any, ...]]:
+    """
+    Build an ``operator.attrgetter``/``itemgetter`` that always returns a tuple.
+
+    The stdlib getters return a bare value when given a single key; rubrics
+    with one metric would otherwise need special-casing at every call site.
+    """
+    if len(keys) == 1:
+        get_one = getter_factory(keys[0])
+        return lambda obj: (get_one(obj),)
+    return getter_factory(*keys)
+
+
+def _pack_values(values: Tuple[bool, ...]) -> int:
+    """
+    Pack a tuple of metric booleans into a single integer bitmask.
+
+    ``bytes(values)`` lays the booleans out as one 0/1 byte per metric, and
+    ``int.from_bytes`` turns that buffer into an integer in one C call, so
+    metric ``i`` lands in bit ``8 * i``. Rubric masks use the same layout,
+    which lets the pass/fail check run as a couple of integer operations
+    plus ``int.bit_count()`` regardless of the number of metrics.
+    """
+    return int.from_bytes(bytes(values), "little")
+
+
+def _compile_result_check(
+    rubric_id: str,
+    mandatory_ids: Tuple[str, ...],
+    cumulative_ids: Tuple[str, ...],
+    threshold: int,
+    check_types: bool = False,
+) -> Callable[[Dict[str, Any]], bool]:
+    """
+    Generate a pass/fail check specialized to one rubric.
+
+    The metric IDs and threshold are inlined into the source of a small
+    function, e.g. for mandatory ``M1`` and cumulative ``C1``/``C2`` with a
+    threshold of 1::
+
+        def _check(d):
+            return d['M1'] and d['C1'] + d['C2'] >= 1
+
+    so checking a result is a handful of dict lookups with no iteration over
+    metric definitions. Metric IDs are validated Python identifiers, which
+    keeps their ``repr`` safe to embed. The input must already have passed
+    the presence/boolean checks in ``_check_result``.
+
+    With ``check_types=True`` the function performs those checks itself,
+    reading every metric value once and raising ``KeyError`` for a missing
+    metric or ``TypeError`` for a non-boolean value::
+
+        def _check(d):
+            v0 = d['M1']
+            v1 = d['C1']
+            v2 = d['C2']
+            if type(v0) is not bool or type(v1) is not bool or type(v2) is not bool:
+                raise TypeError
+            return v0 and v1 + v2 >= 1
+
+    Callers re-run ``_check_result`` on either exception to build the
+    detailed error message.
+    """
+    lines = []
+    if check_types:
+        names = {metric_id: f"v{i}" for i, metric_id in enumerate(mandatory_ids + cumulative_ids)}
+        lines.extend(f"    {name} = d[{metric_id!r}]" for metric_id, name in names.items())
+        lines.append(f"    if {' or '.join(f'type({name}) is not bool' for name in names.values())}:")
+        lines.append("        raise TypeError")
+        ref = names.__getitem__
+    else:
+        ref = "d[{!r}]".format
+    terms = [ref(metric_id) for metric_id in mandatory_ids]
+    if threshold > len(cumulative_ids):
+        # Unreachable threshold; validated rubrics reject it after this runs
+        terms.append("False")
+    elif threshold > 0:
+        terms.append(" + ".join(ref(metric_id) for metric_id in cumulative_ids) + f" >= {threshold}")
+    lines.append(f"    return {' and '.join(terms) or 'True'}")
+    source = "def _check(d):\n" + "\n".join(lines) + "\n"
+    namespace: Dict[str, Any] = {}
+    exec(compile(source, f"<rubric:{rubric_id}>", "exec"), namespace)
+    return namespace["_check"]
+
+
+@functools.lru_cache(maxsize=256)
+def _build_json_schema(rubric_id: str, metrics: Tuple[Tuple[str, str], ...]) -> Dict[str, Any]:
+    """
+    Build the JSON Schema returned by EvaluationRubric.to_json_schema().
+
+    The schema depends only on the rubric ID and each metric's ID and
+    rubric text, passed as ``(id, rubric)`` pairs, so it is cached on those
+    values and shared by all rubrics that agree on them. The cached dict is
+    never handed out; callers receive a copy from ``_copy_json_schema``.
+    """
+    properties = {}
+    required = []
+
+    # Add a field for each metric
+    for metric_id, rubric in metrics:
+        # Boolean field for the evaluation result
+        properties[metric_id] = {
+            "type": "boolean",
+            "description": f"Does this pass the criterion: {rubric}"
+        }
+        required.append(metric_id)
+
+        # Optional reasoning field
+        properties[f"{metric_id}_reasoning"] = {
+            "type": "string",
+            "description": f"Explanation for the {metric_id} evaluation"
+        }
+
+    schema = {
+        "type": "object",
+        "properties": properties,
+        "required": required,
+        "additionalProperties": False,
+        "description": f"Evaluation results for rubric: {rubric_id}"
+    }
+
+    return schema
+
+
+def _copy_json_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy a schema built by ``_build_json_schema``.
+
+    The schema has a fixed shape (flat property dicts of strings and a list
+    of required IDs), so copying those containers yields a fully
+    independent copy without the generic walk of ``copy.deepcopy``.
+    """
+    return {
+        **schema,
+        "properties": {name: dict(prop) for name, prop in schema["properties"].items()},
+        "required": list(schema["required"]),
+    }
+
 
 class MetricDefinition(BaseModel):
     """
@@ -78,13 +247,51 @@ class MetricDefinition(BaseModel):
 
     The 'weight' is implicitly 1.0, meaning the cumulative score is the simple
     count of passed cumulative metrics.
+
+    Metric definitions are immutable (and hashable), so a rubric's
+    precomputed lookups cannot go stale through a nested metric. Being
+    immutable, instances are never revalidated or copied when passed to a
+    rubric or another model.
     """
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, revalidate_instances="never")
 
     id: str = Field(..., description="Unique identifier for the metric (e.g., 'M1', 'code_style_pass')")
     rubric: str = Field(..., description="The specific pass/fail criterion, acting as the rubric for this metric.")
     mandatory: bool = Field(default=False, description="If True, this metric must pass for the evaluation to pass.")
 
+    @classmethod
+    def build_trusted(cls, id: str, rubric: str, mandatory: bool = False) -> "MetricDefinition":
+        """
+        Create a metric definition without running validation.
+
+        Uses ``model_construct``, so the ID checks of validate_metric_id are
+        skipped; the ID is still interned. Only use this for definitions known
+        to be valid, e.g. from library code or test fixtures; untrusted input
+        (such as rubrics loaded from user-provided files) must use the regular
+        constructor.
+
+        Parameters
+        ----------
+        id : str
+            Unique identifier for the metric; must be a valid ID.
+        rubric : str
+            The pass/fail criterion.
+        mandatory : bool, default False
+            If True, this metric must pass for the evaluation to pass.
+
+        Returns
+        -------
+        MetricDefinition
+            The unvalidated metric definition.
+
+        Examples
+        --------
+        >>> MetricDefinition.build_trusted("M1", "Code compiles", mandatory=True).mandatory
+        True
+        """
+        # Intern the ID as validate_metric_id would, so lookups keyed by it stay fast
+        return cls.model_construct(id=sys.intern(id), rubric=rubric, mandatory=mandatory)
+
     @field_validator('id')
     @classmethod
     def validate_metric_id(cls, metric_id: str) -> str:
@@ -104,7 +311,7 @@ class MetricDefinition(BaseModel):
         Returns
         -------
         str
-            The validated metric ID.
+            The validated metric ID, interned with ``sys.intern``.
 
         Raises
         ------
@@ -156,32 +363,203 @@ class MetricDefinition(BaseModel):
                 "Please choose a different ID."
             )
 
-        return metric_id
+        # Interned IDs are shared between rubrics and match the identifier
+        # constants of generated code and model field names by identity,
+        # which is the fastest case of a dict lookup
+        return sys.intern(metric_id)
 
 
 class EvaluationRubric(BaseModel):
     """
     The complete evaluation rubric, defining all metrics and the passing threshold.
+
+    Rubrics are immutable once constructed, which lets the generated prompt
+    text, JSON Schema and Pydantic result model be built once and reused.
+    Use ``model_copy(update=...)`` to derive a modified rubric. Rubrics
+    used as fields of other models are passed through without being
+    revalidated or copied. Metrics are stored as a tuple (any sequence is
+    accepted as input), so rubrics are hashable.
     """
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, revalidate_instances="never")
 
     rubric_id: str = Field(..., description="A unique identifier for this specific rubric.")
-    metrics: List[MetricDefinition] = Field(..., description="All evaluation metrics. Use mandatory=True for metrics that must all pass.")
+    metrics: Tuple[MetricDefinition, ...] = Field(..., description="All evaluation metrics. Use mandatory=True for metrics that must all pass.")
     passing_score_threshold: int = Field(..., ge=0, description="The minimum required COUNT of passed cumulative metrics to pass this component of the evaluation.")
 
+    @classmethod
+    def build_trusted(
+        cls,
+        rubric_id: str,
+        metrics: Sequence[MetricDefinition],
+        passing_score_threshold: int
+    ) -> "EvaluationRubric":
+        """
+        Create a rubric without running validation.
+
+        Uses ``model_construct``, so the metric list and threshold checks are
+        skipped; the precomputed lookups of model_post_init are still built,
+        so the rubric behaves like a validated one. Only use this for rubric
+        definitions known to be valid, e.g. library-internal rubric factories
+        or test fixtures.
+
+        Parameters
+        ----------
+        rubric_id : str
+            A unique identifier for the rubric.
+        metrics : sequence of MetricDefinition
+            Valid metric definitions with unique IDs; stored as a tuple.
+        passing_score_threshold : int
+            Minimum count of cumulative metrics that must pass; must not
+            exceed the number of cumulative metrics.
+
+        Returns
+        -------
+        EvaluationRubric
+            The unvalidated rubric.
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric.build_trusted(
+        ...     "quick",
+        ...     [MetricDefinition.build_trusted("M1", "Must pass", mandatory=True)],
+        ...     0
+        ... )
+        >>> rubric.validate_result({"M1": True})
+        True
+
+        Notes
+        -----
+        Invalid definitions are not detected. Duplicate or malformed metric
+        IDs in particular lead to wrong results or errors later on.
+        """
+        return cls.model_construct(
+            rubric_id=rubric_id,
+            metrics=tuple(metrics),
+            passing_score_threshold=passing_score_threshold,
+        )
+
+    def model_post_init(self, __context: Any) -> None:
+        """
+        Precompute metric lookups used by the evaluation helpers.
+
+        Stores the metric IDs in definition order and as frozensets (all,
+        mandatory and cumulative), the mandatory and cumulative partitions of
+        the metrics, a getter that reads all metric values from a result
+        model's ``__dict__`` in a single C-level call, the bitmasks selecting
+        mandatory and cumulative metrics from a packed result (see
+        ``_pack_values``), and the prompt text returned by to_prompt_text().
+        The generated pass/fail checks are compiled lazily (see
+        ``_result_check``). The values live in the instance ``__dict__`` (not
+        as fields), so they are excluded from serialization and equality.
+        """
+        ids = tuple(m.id for m in self.metrics)
+        mandatory = tuple(m for m in self.metrics if m.mandatory)
+        cumulative = tuple(m for m in self.metrics if not m.mandatory)
+        self.__dict__["_metric_ids"] = ids
+        self.__dict__["_metric_id_set"] = frozenset(ids)
+        self.__dict__["_mandatory_id_set"] = frozenset(m.id for m in mandatory)
+        self.__dict__["_cumulative_id_set"] = frozenset(m.id for m in cumulative)
+        self.__dict__["_mandatory"] = mandatory
+        self.__dict__["_cumulative"] = cumulative
+        self.__dict__["_values_getter"] = _tuple_getter(operator.itemgetter, ids)
+        self.__dict__["_mandatory_mask"] = sum(1 << (8 * i) for i, m in enumerate(self.metrics) if m.mandatory)
+        self.__dict__["_cumulative_mask"] = sum(1 << (8 * i) for i, m in enumerate(self.metrics) if not m.mandatory)
+        self.__dict__["_prompt_text"] = self._build_prompt_text()
+
+    @functools.cached_property
+    def _result_check(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Return the pass/fail check generated for this rubric.
+
+        Compiled on first use (see ``_compile_result_check``) and cached in
+        the instance ``__dict__``, so rubrics that are never evaluated do not
+        pay for code generation.
+        """
+        return _compile_result_check(
+            self.rubric_id,
+            tuple(m.id for m in self._mandatory),
+            tuple(m.id for m in self._cumulative),
+            self.passing_score_threshold,
+        )
+
+    @functools.cached_property
+    def _strict_result_check(self) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Return the generated pass/fail check that also verifies the input.
+
+        Like ``_result_check`` but with inlined presence/boolean checks
+        (``check_types=True``), compiled on first use and cached.
+        """
+        return _compile_result_check(
+            self.rubric_id,
+            tuple(m.id for m in self._mandatory),
+            tuple(m.id for m in self._cumulative),
+            self.passing_score_threshold,
+            check_types=True,
+        )
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        """
+        Return the pickled state, keeping only the field values.
+
+        The cached lookups include generated functions and classes that
+        cannot be pickled; __setstate__ rebuilds them.
+        """
+        state = super().__getstate__()
+        state["__dict__"] = {name: self.__dict__[name] for name in type(self).model_fields}
+        return state
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        """Restore a pickled rubric and rebuild its precomputed lookups."""
+        super().__setstate__(state)
+        self.model_post_init(None)
+
+    def _bits_pass(self, bits: int) -> bool:
+        """
+        Check a packed result against the rubric.
+
+        All mandatory lanes must be set, and the number of set cumulative
+        lanes (a single popcount) must reach the passing threshold.
+        ``int.bit_count()`` is available on every supported Python (3.10+).
+        """
+        mandatory_mask = self._mandatory_mask
+        return (
+            bits & mandatory_mask == mandatory_mask
+            and (bits & self._cumulative_mask).bit_count() >= self.passing_score_threshold
+        )
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> "EvaluationRubric":
+        """
+        Return a copy of the rubric, optionally with updated fields.
+
+        Behaves like ``BaseModel.model_copy``, except that when ``update`` is
+        given the updated field values are validated like a new rubric (so an
+        unreachable threshold or duplicate metric IDs raise
+        ``ValidationError``) and the precomputed lookups and cached artifacts
+        (prompt text, JSON Schema, result model) are built for the new values.
+        """
+        if not update:
+            return super().model_copy(deep=deep)
+        field_values = {name: self.__dict__[name] for name in type(self).model_fields}
+        if deep:
+            field_values = copy.deepcopy(field_values)
+        field_values.update(update)
+        return type(self).model_validate(field_values)
+
     @property
-    def mandatory_metrics(self) -> List[MetricDefinition]:
+    def mandatory_metrics(self) -> Tuple[MetricDefinition, ...]:
         """
         Return metrics marked as mandatory.
 
         Filters the metrics list to return only those with mandatory=True.
         These metrics must all pass for the overall evaluation to pass.
+        The partition is computed once when the rubric is created.
 
         Returns
         -------
-        List[MetricDefinition]
-            List of MetricDefinition instances where mandatory=True.
-            Empty list if no mandatory metrics are defined.
+        Tuple[MetricDefinition, ...]
+            MetricDefinition instances where mandatory=True, in definition
+            order. Empty tuple if no mandatory metrics are defined.
 
         Examples
         --------
@@ -198,22 +576,23 @@ class EvaluationRubric(BaseModel):
         >>> rubric.mandatory_metrics[0].id
         'M1'
         """
-        return [m for m in self.metrics if m.mandatory]
+        return self._mandatory
 
     @property
-    def cumulative_metrics(self) -> List[MetricDefinition]:
+    def cumulative_metrics(self) -> Tuple[MetricDefinition, ...]:
         """
         Return metrics that contribute to the cumulative score.
 
         Filters the metrics list to return only those with mandatory=False.
         These metrics are scored, and a minimum number must pass based on
-        the passing_score_threshold.
+        the passing_score_threshold. The partition is computed once when the
+        rubric is created.
 
         Returns
         -------
-        List[MetricDefinition]
-            List of MetricDefinition instances where mandatory=False.
-            Empty list if no cumulative metrics are defined.
+        Tuple[MetricDefinition, ...]
+            MetricDefinition instances where mandatory=False, in definition
+            order. Empty tuple if no cumulative metrics are defined.
 
         Examples
         --------
@@ -231,28 +610,72 @@ class EvaluationRubric(BaseModel):
         >>> [m.id for m in rubric.cumulative_metrics]
         ['C1', 'C2']
         """
-        return [m for m in self.metrics if not m.mandatory]
+        return self._cumulative
 
-    @field_validator('passing_score_threshold')
-    @classmethod
-    def check_threshold_validity(cls, threshold: int, info: ValidationInfo) -> int:
+    @property
+    def mandatory_ids(self) -> FrozenSet[str]:
+        """
+        Return the IDs of the mandatory metrics.
+
+        Returns
+        -------
+        FrozenSet[str]
+            IDs of metrics where mandatory=True, computed once when the
+            rubric is created.
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="test",
+        ...     metrics=[
+        ...         MetricDefinition(id="M1", rubric="Must pass", mandatory=True),
+        ...         MetricDefinition(id="C1", rubric="Optional")
+        ...     ],
+        ...     passing_score_threshold=0
+        ... )
+        >>> "M1" in rubric.mandatory_ids
+        True
+        """
+        return self._mandatory_id_set
+
+    @property
+    def cumulative_ids(self) -> FrozenSet[str]:
+        """
+        Return the IDs of the cumulative metrics.
+
+        Returns
+        -------
+        FrozenSet[str]
+            IDs of metrics where mandatory=False, computed once when the
+            rubric is created.
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="test",
+        ...     metrics=[
+        ...         MetricDefinition(id="M1", rubric="Must pass", mandatory=True),
+        ...         MetricDefinition(id="C1", rubric="Optional")
+        ...     ],
+        ...     passing_score_threshold=0
+        ... )
+        >>> sorted(rubric.cumulative_ids)
+        ['C1']
+        """
+        return self._cumulative_id_set
+
+    @model_validator(mode='after')
+    def check_threshold_validity(self) -> "EvaluationRubric":
         """
         Validate that the passing threshold is achievable.
 
         Ensures the passing_score_threshold does not exceed the number of
         cumulative metrics available, as this would make passing impossible.
 
-        Parameters
-        ----------
-        threshold : int
-            The proposed passing score threshold.
-        info : ValidationInfo
-            Pydantic validation context containing other field values.
-
         Returns
         -------
-        int
-            The validated threshold value.
+        EvaluationRubric
+            The validated rubric.
 
         Raises
         ------
@@ -261,13 +684,14 @@ class EvaluationRubric(BaseModel):
 
         Notes
         -----
-        This is a Pydantic field validator that runs during model instantiation.
-        It ensures logical consistency of the rubric configuration.
+        This is a Pydantic model validator that runs after the fields are
+        validated and ``model_post_init`` has partitioned the metrics, so the
+        counts come from the precomputed partitions instead of another scan.
+        It only runs when the metrics themselves are valid.
         """
-        metrics = info.data.get('metrics', [])
-        # Count mandatory and cumulative metrics
-        mandatory_count = sum(1 for m in metrics if m.mandatory)
-        cumulative_count = sum(1 for m in metrics if not m.mandatory)
+        threshold = self.passing_score_threshold
+        mandatory_count = len(self._mandatory)
+        cumulative_count = len(self._cumulative)
 
         if threshold > cumulative_count:
             raise ValueError(
@@ -277,11 +701,11 @@ class EvaluationRubric(BaseModel):
                 f"{cumulative_count} cumulative metric(s). "
                 f"Please set passing_score_threshold to {cumulative_count} or lower."
             )
-        return threshold
+        return self
 
     @field_validator('metrics')
     @classmethod
-    def validate_metrics_list(cls, metrics: List[MetricDefinition]) -> List[MetricDefinition]:
+    def validate_metrics_list(cls, metrics: Tuple[MetricDefinition, ...]) -> Tuple[MetricDefinition, ...]:
         """
         Validate the metrics list for various constraints.
 
@@ -292,13 +716,13 @@ class EvaluationRubric(BaseModel):
 
         Parameters
         ----------
-        metrics : List[MetricDefinition]
-            The list of metric definitions to validate.
+        metrics : Tuple[MetricDefinition, ...]
+            The metric definitions to validate.
 
         Returns
         -------
-        List[MetricDefinition]
-            The validated metrics list.
+        Tuple[MetricDefinition, ...]
+            The validated metrics.
 
         Raises
         ------
@@ -331,7 +755,17 @@ class EvaluationRubric(BaseModel):
                 "Consider splitting into multiple rubrics or reducing metric count."
             )
 
-        mandatory_count = sum(1 for m in metrics if m.mandatory)
+        # Count mandatory metrics and collect duplicate IDs in a single pass
+        mandatory_count = 0
+        seen = set()
+        duplicates = set()
+        for m in metrics:
+            mandatory_count += m.mandatory
+            if m.id in seen:
+                duplicates.add(m.id)
+            else:
+                seen.add(m.id)
+
         if mandatory_count > MAX_MANDATORY_METRICS:
             raise ValueError(
                 f"Too many mandatory metrics: {mandatory_count} exceeds maximum of {MAX_MANDATORY_METRICS}. "
@@ -339,11 +773,9 @@ class EvaluationRubric(BaseModel):
             )
 
         # Check for duplicate IDs
-        ids = [m.id for m in metrics]
-        duplicates = [id for id in set(ids) if ids.count(id) > 1]
         if duplicates:
             raise ValueError(
-                f"Duplicate metric IDs found: {', '.join(sorted(set(duplicates)))}. "
+                f"Duplicate metric IDs found: {', '.join(sorted(duplicates))}. "
                 "Each metric must have a unique ID."
             )
 
@@ -385,35 +817,43 @@ class EvaluationRubric(BaseModel):
         The generated text is designed to be prepended to LLM prompts
         to provide clear evaluation criteria. The format emphasizes the
         distinction between mandatory and cumulative metrics.
+
+        The text is rendered once when the rubric is constructed; every call
+        returns the same string.
         """
+        return self._prompt_text
+
+    def _build_prompt_text(self) -> str:
+        """Render the prompt text returned by to_prompt_text()."""
+        mandatory = self.mandatory_metrics
+        cumulative = self.cumulative_metrics
+        threshold = self.passing_score_threshold
+
         lines = [f"# Evaluation Rubric: {self.rubric_id}", ""]
 
         # Mandatory metrics section
-        if self.mandatory_metrics:
+        if mandatory:
             lines.append("## Mandatory Criteria (ALL must pass)")
             lines.append("")
-            for metric in self.mandatory_metrics:
-                lines.append(f"- **{metric.id}**: {metric.rubric}")
+            lines.extend([f"- **{metric.id}**: {metric.rubric}" for metric in mandatory])
             lines.append("")
 
         # Cumulative metrics section
-        if self.cumulative_metrics:
+        if cumulative:
             lines.append("## Cumulative Criteria")
-            lines.append(f"(Must pass at least {self.passing_score_threshold} of {len(self.cumulative_metrics)})")
+            lines.append(f"(Must pass at least {threshold} of {len(cumulative)})")
             lines.append("")
-            for metric in self.cumulative_metrics:
-                lines.append(f"- **{metric.id}**: {metric.rubric}")
+            lines.extend([f"- **{metric.id}**: {metric.rubric}" for metric in cumulative])
             lines.append("")
 
         # Evaluation instructions
-        lines.append("## Instructions")
-        lines.append("For each criterion above, evaluate whether it passes (Yes) or fails (No).")
+        lines.extend(_PROMPT_INSTRUCTIONS)
 
-        if self.mandatory_metrics:
-            lines.append(f"- All {len(self.mandatory_metrics)} mandatory criteria must pass.")
+        if mandatory:
+            lines.append(f"- All {len(mandatory)} mandatory criteria must pass.")
 
-        if self.cumulative_metrics:
-            lines.append(f"- At least {self.passing_score_threshold} cumulative criteria must pass.")
+        if cumulative:
+            lines.append(f"- At least {threshold} cumulative criteria must pass.")
 
         return "\n".join(lines)
 
@@ -455,38 +895,21 @@ class EvaluationRubric(BaseModel):
         to capture LLM explanations. This is useful for debugging and
         understanding evaluation decisions.
 
+        The schema is built once and cached for rubrics with the same ID and
+        metric texts; every call returns a fresh copy, so callers may modify
+        the returned dictionary.
+
         See Also
         --------
         to_pydantic_model : For type-safe validation with Pydantic models.
         validate_result : To validate results against this schema.
         """
-        properties = {}
-        required = []
-
-        # Add a field for each metric
-        for metric in self.metrics:
-            # Boolean field for the evaluation result
-            properties[metric.id] = {
-                "type": "boolean",
-                "description": f"Does this pass the criterion: {metric.rubric}"
-            }
-            required.append(metric.id)
-
-            # Optional reasoning field
-            properties[f"{metric.id}_reasoning"] = {
-                "type": "string",
-                "description": f"Explanation for the {metric.id} evaluation"
-            }
-
-        schema = {
-            "type": "object",
-            "properties": properties,
-            "required": required,
-            "additionalProperties": False,
-            "description": f"Evaluation results for rubric: {self.rubric_id}"
-        }
-
-        return schema
+        schema = self.__dict__.get("_json_schema")
+        if schema is None:
+            schema = self.__dict__["_json_schema"] = _build_json_schema(
+                self.rubric_id, tuple((m.id, m.rubric) for m in self.metrics)
+            )
+        return _copy_json_schema(schema)
 
     def to_pydantic_model(self) -> Type[BaseModel]:
         """
@@ -526,8 +949,15 @@ class EvaluationRubric(BaseModel):
 
         Notes
         -----
-        The generated model class is cached internally for reuse. The model
-        name follows the pattern: EvaluationResult_{rubric_id}.
+        The generated model class is cached on the rubric, so repeated calls
+        return the same class, and rubrics with identical definitions share
+        one class per process. Instances are immutable (``frozen=True``) and
+        therefore hashable. The model name follows the pattern:
+        EvaluationResult_{rubric_id}.
+
+        ``model_json_schema()`` called without arguments generates the schema
+        once and returns a deep copy of it on every call. Calls with
+        arguments are generated as usual.
 
         Helper methods on the generated model:
         - passes(): Check if evaluation meets all requirements
@@ -540,6 +970,31 @@ class EvaluationRubric(BaseModel):
         to_json_schema : For JSON Schema generation.
         validate_result : For simple validation without model instantiation.
         """
+        model = self.__dict__.get("_pydantic_model")
+        if model is None:
+            key = self._result_model_key()
+            model = _result_model_cache.get(key)
+            if model is None:
+                model = _result_model_cache[key] = self._build_pydantic_model()
+            self.__dict__["_pydantic_model"] = model
+        return model
+
+    def _result_model_key(self) -> tuple:
+        """
+        Return a hashable key covering every field of the rubric.
+
+        Two rubrics with the same key render the same reports and apply the
+        same pass/fail rule, so the helper methods of a result model built
+        for one are valid for the other.
+        """
+        return (
+            self.rubric_id,
+            tuple((m.id, m.rubric, m.mandatory) for m in self.metrics),
+            self.passing_score_threshold,
+        )
+
+    def _build_pydantic_model(self) -> Type[BaseModel]:
+        """Create the result model class returned by to_pydantic_model()."""
         # Build field definitions for create_model
         field_definitions = {}
 
@@ -562,53 +1017,124 @@ class EvaluationRubric(BaseModel):
         # Define helper methods
         def passes(model_self) -> bool:
             """Returns True if the evaluation passes all requirements."""
-            result_dict = {metric.id: getattr(model_self, metric.id) for metric in rubric_ref.metrics}
-            return rubric_ref.validate_result(result_dict)
+            # Field values are already validated booleans, so the generated
+            # check can read them straight from the instance __dict__
+            return rubric_ref._result_check(model_self.__dict__)
 
         def get_failed_metrics(model_self) -> List[str]:
             """Returns list of metric IDs that failed (returned False)."""
-            return [metric.id for metric in rubric_ref.metrics if not getattr(model_self, metric.id)]
+            values = rubric_ref._values_getter(model_self.__dict__)
+            return [metric_id for metric_id, value in zip(rubric_ref._metric_ids, values) if not value]
 
         def get_passed_metrics(model_self) -> List[str]:
             """Returns list of metric IDs that passed (returned True)."""
-            return [metric.id for metric in rubric_ref.metrics if getattr(model_self, metric.id)]
+            values = rubric_ref._values_getter(model_self.__dict__)
+            return [metric_id for metric_id, value in zip(rubric_ref._metric_ids, values) if value]
 
         def to_report(model_self, title: Optional[str] = None) -> str:
             """Generates a consolidated text report of the evaluation results."""
-            result_dict = {metric.id: getattr(model_self, metric.id) for metric in rubric_ref.metrics}
-            reasoning_dict = {metric.id: getattr(model_self, f"{metric.id}_reasoning", None)
-                            for metric in rubric_ref.metrics}
-            return rubric_ref.generate_report(result_dict, reasoning_dict, title)
+            # Field values are already validated, so render straight from
+            # the instance __dict__ instead of copying and re-checking them
+            values = model_self.__dict__
+            return rubric_ref._render_report(
+                values, rubric_ref._model_reasoning(values), title, rubric_ref._result_check(values)
+            )
 
         # Create the model class dynamically
         model_name = f"EvaluationResult_{self.rubric_id}"
         model = create_model(
             model_name,
-            __config__=ConfigDict(extra="forbid"),
+            __config__=ConfigDict(extra="forbid", frozen=True),
             **field_definitions
         )
 
+        # The schema of the generated model never changes, so the
+        # default-argument schema is generated once; callers get a deep copy
+        # (about 10x cheaper than regenerating) they are free to modify
+        default_schema = None
+
+        def model_json_schema(cls, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+            """Returns the JSON schema, generated once for the default arguments."""
+            nonlocal default_schema
+            if args or kwargs or cls is not model:
+                return BaseModel.model_json_schema.__func__(cls, *args, **kwargs)
+            if default_schema is None:
+                default_schema = BaseModel.model_json_schema.__func__(cls)
+            return copy.deepcopy(default_schema)
+
         # Add helper methods to the model class
         model.passes = passes
         model.get_failed_metrics = get_failed_metrics
         model.get_passed_metrics = get_passed_metrics
         model.to_report = to_report
+        model.model_json_schema = classmethod(model_json_schema)
 
         return model
 
-    def validate_result(self, result: Union[str, Dict[str, Any]]) -> bool:
+    def build_result(self, data: Dict[str, Any], validate: bool = True) -> BaseModel:
+        """
+        Create a result model instance from a dictionary.
+
+        Parameters
+        ----------
+        data : dict
+            Mapping of metric IDs (and optional ``<id>_reasoning`` keys) to
+            values.
+        validate : bool, default True
+            If True, the data is validated with ``model_validate``. If False,
+            the instance is created with ``model_construct``, which skips
+            validation entirely and is only safe for trusted data, e.g.
+            results that were already validated or produced by your own code.
+
+        Returns
+        -------
+        BaseModel
+            Instance of the model returned by to_pydantic_model().
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If ``validate`` is True and the data does not match the model.
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="test",
+        ...     metrics=[MetricDefinition(id="M1", rubric="Must pass", mandatory=True)],
+        ...     passing_score_threshold=0
+        ... )
+        >>> rubric.build_result({"M1": True}).passes()
+        True
+        >>> rubric.build_result({"M1": False}, validate=False).passes()
+        False
+
+        Notes
+        -----
+        With ``validate=False`` nothing checks that metric values are
+        booleans or that all metrics are present; malformed data leads to
+        wrong results or errors later on.
+        """
+        model = self.to_pydantic_model()
+        if validate:
+            return model.model_validate(data)
+        return model.model_construct(**data)
+
+    def validate_result(self, result: Union[str, bytes, Dict[str, Any], BaseModel]) -> bool:
         """
         Validate an LLM-generated evaluation result against this rubric.
 
         Checks that all mandatory metrics pass and the cumulative score meets
-        the required threshold. Accepts either a JSON string or dictionary.
+        the required threshold. Accepts a JSON string, a dictionary or a
+        result model instance.
 
         Parameters
         ----------
-        result : str or dict
+        result : str, bytes, dict or BaseModel
             Evaluation results as either:
-            - JSON string containing boolean values for each metric ID
+            - JSON string (or UTF-8 bytes) containing boolean values for each metric ID
             - Dictionary mapping metric IDs to boolean values
+            - Result model instance (e.g. from to_pydantic_model()), whose
+              field values are read directly without ``model_dump()``
 
         Returns
         -------
@@ -642,32 +1168,323 @@ class EvaluationRubric(BaseModel):
         This method performs strict validation - all metric IDs must be present
         and have boolean values. Additional fields in the result are ignored.
 
+        Only the pass/fail outcome is computed; no result model instance is
+        created. Use validate_and_return() when the reasoning fields or the
+        model's helper methods are needed as well.
+
         See Also
         --------
         to_pydantic_model : For creating a validating model class.
+        validate_and_return : To get a validated result model instance.
+        validate_results_batch : To validate many results in one call.
         generate_report : To create a formatted report of results.
         """
+        return self._evaluate(result)
+
+    def find_keys_in_text(self, text: str) -> Set[str]:
+        """
+        Find the metric IDs mentioned in free text.
+
+        Useful for custom parsers of LLM output that is not clean JSON,
+        e.g. markdown with lines like ``M1: yes``. An ID counts as mentioned
+        when it appears as a whole word, so ``M1`` does not match inside
+        ``M10`` or ``AM1``.
+
+        Parameters
+        ----------
+        text : str
+            Text to search.
+
+        Returns
+        -------
+        Set[str]
+            Metric IDs of this rubric that occur in the text.
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="test",
+        ...     metrics=[
+        ...         MetricDefinition(id="M1", rubric="Must pass", mandatory=True),
+        ...         MetricDefinition(id="C1", rubric="Optional")
+        ...     ],
+        ...     passing_score_threshold=0
+        ... )
+        >>> rubric.find_keys_in_text("**M1**: yes, M10: no")
+        {'M1'}
+
+        Notes
+        -----
+        The text is scanned once for word tokens, which are intersected with
+        the rubric's precomputed set of IDs, so the cost is linear in the
+        length of the text and independent of the number of metrics.
+        """
+        return set(_WORD_RE.findall(text)).intersection(self._metric_id_set)
+
+    def validate_result_trusted(self, result: Dict[str, Any]) -> bool:
+        """
+        Compute the pass/fail outcome of a result that is known to be valid.
+
+        Fast path for dictionaries whose shape is already guaranteed, e.g.
+        ``model_dump()`` output of the model returned by to_pydantic_model()
+        or results checked earlier with validate_result(). Only the mandatory
+        and cumulative rules are evaluated; presence and types of the metric
+        values are not checked.
+
+        Parameters
+        ----------
+        result : dict
+            Dictionary with a boolean value for every metric ID.
+
+        Returns
+        -------
+        bool
+            True if the evaluation passes, False otherwise.
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="test",
+        ...     metrics=[
+        ...         MetricDefinition(id="M1", rubric="Must pass", mandatory=True),
+        ...         MetricDefinition(id="C1", rubric="Optional")
+        ...     ],
+        ...     passing_score_threshold=1
+        ... )
+        >>> rubric.validate_result_trusted({"M1": True, "C1": False})
+        False
+
+        Notes
+        -----
+        Untrusted input, such as raw LLM output, must go through
+        validate_result(). A missing metric raises ``KeyError`` here, and
+        non-boolean values silently produce a wrong outcome.
+
+        See Also
+        --------
+        validate_result : Validating variant for untrusted input.
+        build_result : To build a result model instance without validation.
+        """
+        return self._result_check(result)
+
+    def validate_and_return(self, result: Union[str, bytes, Dict[str, Any]]) -> BaseModel:
+        """
+        Validate an evaluation result and return it as a result model instance.
+
+        Unlike validate_result(), which only computes the pass/fail outcome,
+        this builds an instance of the model returned by to_pydantic_model(),
+        giving access to the reasoning fields and the helper methods.
+
+        Parameters
+        ----------
+        result : str, bytes or dict
+            JSON string (or UTF-8 bytes) or dictionary with a boolean value
+            for each metric ID and optional ``<id>_reasoning`` strings.
+
+        Returns
+        -------
+        BaseModel
+            Validated instance of the rubric's result model.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If the result is malformed, misses a metric, has non-boolean
+            metric values or contains unknown fields (the result model
+            forbids extra fields). ``ValidationError`` is a ``ValueError``.
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="test",
+        ...     metrics=[MetricDefinition(id="M1", rubric="Must pass", mandatory=True)],
+        ...     passing_score_threshold=0
+        ... )
+        >>> evaluation = rubric.validate_and_return('{"M1": true, "M1_reasoning": "Looks good"}')
+        >>> evaluation.passes(), evaluation.M1_reasoning
+        (True, 'Looks good')
+
+        See Also
+        --------
+        validate_result : For the pass/fail outcome only.
+        build_result : To build a result model from a trusted dictionary.
+        """
+        model = self.to_pydantic_model()
+        if isinstance(result, (str, bytes)):
+            return model.model_validate_json(result)
+        return model.model_validate(result)
+
+    def decode_results(self, raw: Union[str, bytes]) -> List[BaseModel]:
+        """
+        Parse a JSON array of evaluation results into result model instances.
+
+        Intended for bulk ingestion, e.g. loading stored evaluation results
+        from disk for alignment scoring. The whole array is parsed and
+        validated in a single pydantic-core call instead of one
+        validate_and_return() call per item.
+
+        Parameters
+        ----------
+        raw : str or bytes
+            JSON array (or its UTF-8 bytes) whose items are objects with a
+            boolean value for each metric ID and optional ``<id>_reasoning``
+            strings.
+
+        Returns
+        -------
+        List[BaseModel]
+            Validated instances of the rubric's result model, in array order.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If the input is not a JSON array or any item is malformed, misses
+            a metric, has non-boolean metric values or contains unknown
+            fields. Errors are reported with the item index in their location.
+            ``ValidationError`` is a ``ValueError``.
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="test",
+        ...     metrics=[MetricDefinition(id="M1", rubric="Must pass", mandatory=True)],
+        ...     passing_score_threshold=0
+        ... )
+        >>> results = rubric.decode_results(b'[{"M1": true}, {"M1": false, "M1_reasoning": "Crashed"}]')
+        >>> [result.passes() for result in results]
+        [True, False]
+
+        See Also
+        --------
+        validate_and_return : To parse a single result.
+        calculate_alignment : To compare two lists of decoded results.
+        """
+        adapter = self.__dict__.get("_results_adapter")
+        if adapter is None:
+            adapter = self.__dict__["_results_adapter"] = TypeAdapter(List[self.to_pydantic_model()])
+        return adapter.validate_json(raw)
+
+    def validate_results_batch(self, results: List[Union[str, bytes, Dict[str, Any], BaseModel]]) -> List[bool]:
+        """
+        Validate many evaluation results against this rubric.
+
+        Equivalent to calling validate_result() on each item.
+
+        Parameters
+        ----------
+        results : list of str, bytes, dict or BaseModel
+            Evaluation results, each either a JSON string (or UTF-8 bytes), a
+            dictionary mapping metric IDs to boolean values, or a result
+            model instance.
+
+        Returns
+        -------
+        List[bool]
+            Pass/fail outcome for each result, in input order.
+
+        Raises
+        ------
+        ValueError
+            If any result is malformed (see validate_result).
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="test",
+        ...     metrics=[
+        ...         MetricDefinition(id="M1", rubric="Must pass", mandatory=True),
+        ...         MetricDefinition(id="C1", rubric="Optional")
+        ...     ],
+        ...     passing_score_threshold=1
+        ... )
+        >>> rubric.validate_results_batch(['{"M1": true, "C1": true}', {"M1": True, "C1": False}])
+        [True, False]
+
+        See Also
+        --------
+        validate_result : To validate a single result.
+        """
+        # Inline the dict fast path of _evaluate() with the check bound once
+        strict_check = self._strict_result_check
+        outcomes = []
+        for result in results:
+            if type(result) is dict:
+                try:
+                    outcomes.append(strict_check(result))
+                    continue
+                except (KeyError, TypeError):
+                    pass
+            outcomes.append(self._evaluate(result))
+        return outcomes
+
+    def _evaluate(self, result: Union[str, bytes, Dict[str, Any], BaseModel]) -> bool:
+        """
+        Validate a single result and compute its pass/fail outcome.
+
+        Dictionaries go straight to the generated strict check, which
+        verifies presence and types of all metric values inline; only if it
+        rejects the input does ``_check_result`` run to raise the detailed
+        error. Model instances are checked the same way through their
+        ``__dict__``, which holds the field values. Other input is parsed and
+        checked by ``_check_result``.
+        """
+        if isinstance(result, BaseModel):
+            result = result.__dict__
+        if isinstance(result, dict):
+            try:
+                return self._strict_result_check(result)
+            except (KeyError, TypeError):
+                pass
+        # Check mandatory metrics and cumulative threshold with the generated check
+        return self._result_check(self._check_result(result))
+
+    def _json_result_adapter(self) -> TypeAdapter:
+        """
+        Return a TypeAdapter validating JSON results against this rubric.
+
+        The adapter targets a TypedDict with a ``StrictBool`` per metric ID,
+        so pydantic-core parses the JSON, checks presence and types of all
+        metric values, and drops other keys (e.g. reasoning) in a single
+        Rust call. Built on first use and cached on the instance.
+        """
+        adapter = self.__dict__.get("_json_adapter")
+        if adapter is None:
+            typed_dict = TypedDict(
+                f"EvaluationValues_{self.rubric_id}",
+                {metric_id: StrictBool for metric_id in self._metric_ids},
+            )
+            adapter = self.__dict__["_json_adapter"] = TypeAdapter(typed_dict)
+        return adapter
+
+    def _check_result(self, result: Union[str, bytes, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Parse and structurally validate a single evaluation result.
+
+        Returns the result as a dictionary once every metric ID is known to
+        be present with a boolean value; raises ValueError otherwise. JSON
+        strings and bytes are parsed and checked in one pass by a strict
+        TypeAdapter (see ``_json_result_adapter``); only when that fails are
+        they re-parsed below to produce the detailed error message.
+        """
         # Parse JSON string if provided
-        if isinstance(result, str):
+        if isinstance(result, (str, bytes)):
+            try:
+                return self._json_result_adapter().validate_json(result)
+            except ValidationError:
+                pass
             try:
-                result = json.loads(result)
-            except json.JSONDecodeError as e:
+                result = from_json(result)
+            except ValueError as e:
                 raise ValueError(f"Invalid JSON string: {e}")
 
         if not isinstance(result, dict):
             raise ValueError(f"Result must be a JSON string or dictionary, got {type(result).__name__}")
 
-        # Check all metric IDs are present
-        missing_metrics = []
-        for metric in self.metrics:
-            if metric.id not in result:
-                missing_metrics.append(metric.id)
-
-        if missing_metrics:
-            mandatory_missing = [m for m in missing_metrics if any(
-                metric.id == m and metric.mandatory for metric in self.metrics
-            )]
-            cumulative_missing = [m for m in missing_metrics if m not in mandatory_missing]
+        # Check all metric IDs are present (a C-level keys-view comparison)
+        if not result.keys() >= self._metric_id_set:
+            missing_metrics = [metric_id for metric_id in self._metric_ids if metric_id not in result]
+            mandatory_missing = [m for m in missing_metrics if m in self._mandatory_id_set]
+            cumulative_missing = [m for m in missing_metrics if m not in self._mandatory_id_set]
 
             error_parts = [f"Missing evaluation results for {len(missing_metrics)} metric(s):"]
             if mandatory_missing:
@@ -678,27 +1495,16 @@ class EvaluationRubric(BaseModel):
 
             raise ValueError('\n'.join(error_parts))
 
-        # Validate all values are boolean
-        for metric in self.metrics:
-            value = result[metric.id]
-            if not isinstance(value, bool):
-                metric_def = next(m for m in self.metrics if m.id == metric.id)
+        # Validate all values are boolean (bool cannot be subclassed, so an
+        # exact type check is equivalent to isinstance)
+        for metric, value in zip(self.metrics, self._values_getter(result)):
+            if type(value) is not bool:
                 raise ValueError(
                     f"Invalid result for metric '{metric.id}': expected boolean, got {type(value).__name__}. "
-                    f"Metric rubric: '{metric_def.rubric[:50]}{'...' if len(metric_def.rubric) > 50 else ''}'"
+                    f"Metric rubric: '{metric.rubric[:50]}{'...' if len(metric.rubric) > 50 else ''}'"
                 )
 
-        # Check mandatory metrics
-        for metric in self.mandatory_metrics:
-            if not result[metric.id]:
-                return False
-
-        # Check cumulative metrics
-        cumulative_passed = sum(1 for m in self.cumulative_metrics if result[m.id])
-        if cumulative_passed < self.passing_score_threshold:
-            return False
-
-        return True
+        return result
 
     def generate_report(self, result: Dict[str, Any], reasoning: Optional[Dict[str, Optional[str]]] = None, title: Optional[str] = None) -> str:
         """
@@ -759,95 +1565,182 @@ class EvaluationRubric(BaseModel):
         validate_result : To check if results pass without generating a report.
         to_pydantic_model : Model's to_report() method provides similar functionality.
         """
-        if reasoning is None:
-            reasoning = {}
+        return self._render_report(result, reasoning or {}, title, self.validate_result(result))
 
-        lines = []
-        report_title = title if title else f"Evaluation Report: {self.rubric_id}"
-        lines.append(f"# {report_title}")
-        lines.append("")
+    def generate_reports_batch(
+        self,
+        results: List[Union[Dict[str, Any], BaseModel]],
+        reasonings: Optional[List[Optional[Dict[str, Optional[str]]]]] = None,
+        title: Optional[str] = None
+    ) -> List[str]:
+        """
+        Generate formatted text reports for many evaluation results.
+
+        Produces the same output as calling `generate_report` once per
+        result, but the per-metric lines that do not depend on the result
+        are formatted once per rubric and reused for every report.
+
+        Parameters
+        ----------
+        results : list of dict or BaseModel
+            Evaluation results, either dictionaries mapping metric IDs to
+            boolean values or instances of the model from `to_pydantic_model`.
+        reasonings : list of dict, optional
+            One reasoning dictionary (or None) per result. If omitted,
+            reasoning is taken from the ``<metric_id>_reasoning`` fields of
+            result models, and left out for dictionary results.
+        title : str, optional
+            Custom title used for every report. If not provided,
+            defaults to "Evaluation Report: {rubric_id}".
+
+        Returns
+        -------
+        list of str
+            One markdown report per result, in input order.
+
+        Raises
+        ------
+        ValueError
+            If `reasonings` and `results` differ in length, or if any
+            result fails validation (see `validate_result`).
+
+        Examples
+        --------
+        >>> rubric = EvaluationRubric(
+        ...     rubric_id="review",
+        ...     metrics=[MetricDefinition(id="M1", rubric="No errors", mandatory=True)],
+        ...     passing_score_threshold=0
+        ... )
+        >>> reports = rubric.generate_reports_batch([{"M1": True}, {"M1": False}])
+        >>> [report.split('\\n')[2] for report in reports]
+        ['**Overall Result: PASS**', '**Overall Result: FAIL**']
+        """
+        if reasonings is not None and len(reasonings) != len(results):
+            raise ValueError(
+                f"Expected {len(results)} reasoning entries, got {len(reasonings)}"
+            )
+
+        reports = []
+        for i, result in enumerate(results):
+            if isinstance(result, BaseModel):
+                values = result.__dict__
+                reasoning = reasonings[i] if reasonings is not None else self._model_reasoning(values)
+            else:
+                values = result
+                reasoning = reasonings[i] if reasonings is not None else None
+            reports.append(
+                self._render_report(values, reasoning or {}, title, self.validate_result(values))
+            )
+        return reports
 
-        # Determine overall pass/fail
-        overall_pass = self.validate_result(result)
-        status = "PASS" if overall_pass else "FAIL"
-        lines.append(f"**Overall Result: {status}**")
-        lines.append("")
+    def _model_reasoning(self, values: Dict[str, Any]) -> Dict[str, Optional[str]]:
+        """
+        Collect the reasoning fields of a result model, keyed by metric ID.
+
+        The reasoning field names are formatted on first use and cached on the
+        instance.
+        """
+        keys = self.__dict__.get("_reasoning_keys")
+        if keys is None:
+            keys = self.__dict__["_reasoning_keys"] = tuple(
+                (metric_id, f"{metric_id}_reasoning") for metric_id in self._metric_ids
+            )
+        return {metric_id: values.get(key) for metric_id, key in keys}
+
+    def _report_lines(self) -> Tuple[Tuple[Tuple[str, str, str], ...], Tuple[Tuple[str, str, str], ...]]:
+        """
+        Return the result-independent report lines for each metric.
+
+        Each entry holds the metric id, its PASS line and its FAIL line, split
+        into mandatory and cumulative groups. Built on first use and cached on
+        the instance.
+        """
+        lines = self.__dict__.get("_report_lines_cache")
+        if lines is None:
+            def entries(metrics):
+                return tuple(
+                    (
+                        m.id,
+                        f"✓ **{m.id}** [PASS]: {m.rubric}",
+                        f"✗ **{m.id}** [FAIL]: {m.rubric}",
+                    )
+                    for m in metrics
+                )
+            lines = (entries(self.mandatory_metrics), entries(self.cumulative_metrics))
+            self.__dict__["_report_lines_cache"] = lines
+        return lines
+
+    def _render_report(
+        self,
+        result: Dict[str, Any],
+        reasoning: Dict[str, Optional[str]],
+        title: Optional[str],
+        overall_pass: bool
+    ) -> str:
+        """Render one markdown report from precomputed per-metric lines."""
+        mandatory, cumulative = self._report_lines()
+        threshold = self.passing_score_threshold
+
+        report_title = title if title else f"Evaluation Report: {self.rubric_id}"
+        lines = [f"# {report_title}", "", f"**Overall Result: {'PASS' if overall_pass else 'FAIL'}**", ""]
+        summary = ["## Requirements for Passing", ""]
 
         # Mandatory metrics section
-        if self.mandatory_metrics:
+        if mandatory:
             lines.append("## Mandatory Criteria (ALL must pass)")
             lines.append("")
+            summary.append("**Mandatory criteria (ALL must pass):**")
             mandatory_failed = []
-            for metric in self.mandatory_metrics:
-                passed = result.get(metric.id, False)
-                status_symbol = "✓" if passed else "✗"
-                status_text = "PASS" if passed else "FAIL"
-                lines.append(f"{status_symbol} **{metric.id}** [{status_text}]: {metric.rubric}")
-
-                if not passed:
-                    mandatory_failed.append(metric.id)
-
-                # Add reasoning if available
-                metric_reasoning = reasoning.get(metric.id)
+            for metric_id, pass_line, fail_line in mandatory:
+                if result.get(metric_id, False):
+                    lines.append(pass_line)
+                    summary.append(f"  ✓ {metric_id}")
+                else:
+                    lines.append(fail_line)
+                    summary.append(f"  ✗ {metric_id}")
+                    mandatory_failed.append(metric_id)
+
+                metric_reasoning = reasoning.get(metric_id)
                 if metric_reasoning:
                     lines.append(f"  → {metric_reasoning}")
-
-                # Add blank line after each metric to create separate paragraphs
                 lines.append("")
+            summary.append("")
 
             if mandatory_failed:
                 lines.append(f"⚠️  **{len(mandatory_failed)} mandatory metric(s) failed:** {', '.join(mandatory_failed)}")
                 lines.append("")
 
         # Cumulative metrics section
-        if self.cumulative_metrics:
-            cumulative_passed = sum(1 for m in self.cumulative_metrics if result.get(m.id, False))
-            cumulative_total = len(self.cumulative_metrics)
+        if cumulative:
+            metric_lines = []
+            cumulative_passed = 0
+            for metric_id, pass_line, fail_line in cumulative:
+                if result.get(metric_id, False):
+                    cumulative_passed += 1
+                    metric_lines.append(pass_line)
+                else:
+                    metric_lines.append(fail_line)
+
+                metric_reasoning = reasoning.get(metric_id)
+                if metric_reasoning:
+                    metric_lines.append(f"  → {metric_reasoning}")
+                metric_lines.append("")
 
             lines.append("## Cumulative Criteria")
-            lines.append(f"**Score: {cumulative_passed}/{cumulative_total}** (Required: {self.passing_score_threshold})")
+            lines.append(f"**Score: {cumulative_passed}/{len(cumulative)}** (Required: {threshold})")
             lines.append("")
+            lines.extend(metric_lines)
 
-            for metric in self.cumulative_metrics:
-                passed = result.get(metric.id, False)
-                status_symbol = "✓" if passed else "✗"
-                status_text = "PASS" if passed else "FAIL"
-                lines.append(f"{status_symbol} **{metric.id}** [{status_text}]: {metric.rubric}")
-
-                # Add reasoning if available
-                metric_reasoning = reasoning.get(metric.id)
-                if metric_reasoning:
-                    lines.append(f"  → {metric_reasoning}")
-
-                # Add blank line after each metric to create separate paragraphs
-                lines.append("")
-
-            if cumulative_passed < self.passing_score_threshold:
-                needed = self.passing_score_threshold - cumulative_passed
+            summary.append("**Cumulative criteria:**")
+            summary.append(f"  - Need at least {threshold} of {len(cumulative)} to pass")
+            summary.append(f"  - Currently passed: {cumulative_passed}")
+            if cumulative_passed < threshold:
+                needed = threshold - cumulative_passed
                 lines.append(f"⚠️  **Need {needed} more cumulative metric(s) to pass**")
                 lines.append("")
+                summary.append(f"  - Still need: {needed} more")
 
-        # Summary
-        lines.append("## Requirements for Passing")
-        lines.append("")
-
-        if self.mandatory_metrics:
-            lines.append("**Mandatory criteria (ALL must pass):**")
-            for metric in self.mandatory_metrics:
-                passed = result.get(metric.id, False)
-                status = "✓" if passed else "✗"
-                lines.append(f"  {status} {metric.id}")
-            lines.append("")
-
-        if self.cumulative_metrics:
-            cumulative_passed = sum(1 for m in self.cumulative_metrics if result.get(m.id, False))
-            lines.append(f"**Cumulative criteria:**")
-            lines.append(f"  - Need at least {self.passing_score_threshold} of {len(self.cumulative_metrics)} to pass")
-            lines.append(f"  - Currently passed: {cumulative_passed}")
-            if cumulative_passed < self.passing_score_threshold:
-                needed = self.passing_score_threshold - cumulative_passed
-                lines.append(f"  - Still need: {needed} more")
-
+        lines.extend(summary)
         return "\n".join(lines)
 
     def calculate_alignment(
@@ -925,9 +1818,20 @@ class EvaluationRubric(BaseModel):
         - Measuring inter-rater reliability in human evaluations
         - Tracking consistency across model versions
 
+        Only the stored metric values are read, so large batches of trusted
+        results (e.g. already validated with validate_result()) can be built
+        with ``build_result(data, validate=False)``, which skips validation.
+        Untrusted input, such as raw LLM JSON, should still go through
+        validate_and_return() or ``model_validate_json``.
+
+        Each result is judged by the rubric that produced it: results of
+        another rubric's model are scored with their own ``passes()``, not
+        with this rubric's threshold.
+
         See Also
         --------
         to_pydantic_model : To create the result models for comparison.
+        build_result : To create result models, optionally without validation.
         validate_result : For simple pass/fail checking.
         """
         # Normalize inputs to lists
@@ -953,6 +1857,37 @@ class EvaluationRubric(BaseModel):
                 f"Got {len(results_a)} for results_a and {len(results_b)} for results_b"
             )
 
+        # Batches hold one or a few result classes, so check each distinct
+        # class once; the per-item checks only run to report a failure
+        item_types = set(map(type, results_a))
+        item_types.update(map(type, results_b))
+        if not all(issubclass(cls, BaseModel) and hasattr(cls, 'passes') for cls in item_types):
+            self._raise_alignment_item_error(results_a, results_b)
+
+        # Handle empty lists
+        if len(results_a) == 0:
+            return 1.0
+
+        # Single pair: the scalar path is cheaper than materializing rows
+        if len(results_a) == 1:
+            return 1.0 if results_a[0].passes() == results_b[0].passes() else 0.0
+
+        if item_types == {self.to_pydantic_model()}:
+            # Batch of this rubric's results: materialize metric values once
+            # per result and check them against this rubric's masks
+            passes_a = self._batch_passes(results_a)
+            passes_b = self._batch_passes(results_b)
+        else:
+            # Results of other rubrics apply their own pass/fail rule
+            passes_a = [result.passes() for result in results_a]
+            passes_b = [result.passes() for result in results_b]
+        aligned_count = sum(map(operator.eq, passes_a, passes_b))
+
+        return aligned_count / len(results_a)
+
+    @staticmethod
+    def _raise_alignment_item_error(results_a: List[Any], results_b: List[Any]) -> None:
+        """Raise the TypeError for the first result that cannot be aligned."""
         # Validate all items are BaseModel instances
         for i, (item_a, item_b) in enumerate(zip(results_a, results_b)):
             if not isinstance(item_a, BaseModel):
@@ -960,18 +1895,50 @@ class EvaluationRubric(BaseModel):
             if not isinstance(item_b, BaseModel):
                 raise TypeError(f"results_b[{i}] is not a BaseModel instance")
 
-        # Handle empty lists
-        if len(results_a) == 0:
-            return 1.0
-
-        # Calculate alignment
-        aligned_count = 0
+        # Check that all items provide passes() before reading their values
         for item_a, item_b in zip(results_a, results_b):
-            # Check if both have passes() method
             if not hasattr(item_a, 'passes') or not hasattr(item_b, 'passes'):
                 raise TypeError("Results must be instances from to_pydantic_model() with passes() method")
 
-            if item_a.passes() == item_b.passes():
-                aligned_count += 1
+    def _batch_passes(self, results: List[BaseModel]) -> List[bool]:
+        """
+        Evaluate pass/fail for a list of result models in one sweep.
+
+        Each result's metric values are read in bulk (see
+        ``_extract_bool_matrix``) and packed into an integer bitmask, which is
+        then checked against the precomputed mandatory/cumulative masks, so
+        the rubric metric definitions are never rescanned per result.
+
+        Parameters
+        ----------
+        results : List[BaseModel]
+            Instances of the model generated by to_pydantic_model().
 
-        return aligned_count / len(results_a)
\ No newline at end of file
+        Returns
+        -------
+        List[bool]
+            Pass/fail outcome for each result, in input order.
+        """
+        bits_pass = self._bits_pass
+        return [bits_pass(_pack_values(row)) for row in self._extract_bool_matrix(results)]
+
+    def _extract_bool_matrix(self, results: List[BaseModel]) -> List[Tuple[bool, ...]]:
+        """
+        Read the metric values of many result models as rows.
+
+        Pydantic v2 keeps validated field values in the instance ``__dict__``,
+        so an ``itemgetter`` over the metric IDs returns a whole row in one
+        C-level call per result instead of one descriptor lookup per metric.
+
+        Parameters
+        ----------
+        results : List[BaseModel]
+            Instances of the model generated by to_pydantic_model().
+
+        Returns
+        -------
+        List[Tuple[bool, ...]]
+            One tuple of metric values per result, in metric definition order.
+        """
+        getter = self._values_getter
+        return [getter(result.__dict__) for result in results]